@@ -6,12 +6,15 @@ import os
 from core.logging.logger import setup_logger
 from core.tracing.service import trace_method, trace_class
 from agents.core.base_agent import BaseAgent
+from agents.core.graph.checkpointing import get_checkpointer
 from agents.code_assembler.llm.ca_service import CodeAssemblerLLMService
 from agents.code_assembler.ca_state_graph import CodeAssemblerGraphState, validate_state, get_next_stage
 from tools.code_assembler.dependency_analyzer import DependencyAnalyzer
 from tools.code_assembler.file_organizer import FileOrganizer, ProjectType, Component, ComponentType
 from tools.code_assembler.structure_validator import StructureValidator, ValidationLevel
-from tools.code_assembler.config_generator import ConfigGenerator, ConfigType
+from tools.code_assembler.config_generator import ConfigGenerator, ConfigType, GenerationMode
+from tools.code_assembler.conflict_scheduler import ConflictScheduler
+from core.utils.output_writer import session_output_dir
 from memory.memory_manager import MemoryManager
 from memory.base import MemoryType
 from agents.core.monitoring.decorators import monitor_operation
@@ -53,10 +56,10 @@ class CodeAssemblerAgent(BaseAgent):
             
             # Initialize project variables
             self.project_name = f"project_{agent_id}"
-            self.output_dir = os.path.join("outputs", self.project_name)
+            self.output_dir = os.path.join(session_output_dir(), self.project_name)
             
-            # Build the processing graph
-            self.graph = self._build_graph()
+            # Get the shared compiled processing graph
+            self.graph = self._get_compiled_graph()
             self.logger.info("CodeAssemblerAgent initialization completed")
             
         except Exception as e:
@@ -106,7 +109,7 @@ class CodeAssemblerAgent(BaseAgent):
             builder.set_entry_point("start")
             
             # Compile graph
-            compiled_graph = builder.compile()
+            compiled_graph = builder.compile(checkpointer=get_checkpointer())
             self.logger.info("Successfully built and compiled graph")
             
             return compiled_graph
@@ -204,7 +207,11 @@ class CodeAssemblerAgent(BaseAgent):
             
             # Execute graph
             self.logger.debug("Starting graph execution")
-            result = await self.graph.ainvoke(initial_state)
+            result = await self.invoke_graph(
+                initial_state,
+                thread_id=input_data.get("thread_id"),
+                resume=input_data.get("resume", False)
+            )
             
             self.logger.info("Workflow completed successfully")
             
@@ -240,8 +247,10 @@ class CodeAssemblerAgent(BaseAgent):
             else:
                 self.project_name = f"project_{self.agent_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
             
-            # Update output directory
-            self.output_dir = os.path.join("outputs", self.project_name)
+            # Update output directory, below the session's output so it can be exported
+            session_id = input_data.get("session_id") or (input_data.get("context") or {}).get("session_id")
+            output_base_dir = input_data.get("output_base_dir") or session_output_dir(session_id)
+            self.output_dir = os.path.join(output_base_dir, self.project_name)
             
             # Ensure output directory exists
             os.makedirs(self.output_dir, exist_ok=True)
@@ -565,15 +574,16 @@ class CodeAssemblerAgent(BaseAgent):
             if conflicts:
                 self.logger.info(f"Resolving {len(conflicts)} conflicts")
                 
-                for conflict in conflicts:
-                    conflict_resolution = await self.llm_service.resolve_conflict(
-                        conflict=conflict,
-                        components=components,
-                        project_type=state["input"].get("project_type", "generic")
-                    )
-                    
-                    # Apply conflict resolution to components
-                    self._apply_conflict_resolution(conflict_resolution, components)
+                # Independent conflicts are resolved concurrently, small ones in batches
+                scheduler = ConflictScheduler(
+                    llm_service=self.llm_service,
+                    apply_resolution=self._apply_conflict_resolution
+                )
+                await scheduler.resolve(
+                    conflicts=conflicts,
+                    components=components,
+                    project_type=state["input"].get("project_type", "generic")
+                )
             
             # Handle missing components
             missing_components = state["dependency_graph"].get("missing_components", [])
@@ -651,6 +661,10 @@ class CodeAssemblerAgent(BaseAgent):
             
             # Generate a unique ID for the new component
             component_id = f"{component_name}_{datetime.now().strftime('%H%M%S')}"
+            suffix = 1
+            while component_id in components:
+                suffix += 1
+                component_id = f"{component_name}_{datetime.now().strftime('%H%M%S')}_{suffix}"
             
             # Add to components dictionary
             components[component_id] = {
@@ -689,7 +703,8 @@ class CodeAssemblerAgent(BaseAgent):
                 dependency_info=dependency_graph,
                 project_structure=file_structure,
                 output_dir=self.output_dir,
-                llm_service=self.llm_service
+                llm_service=self.llm_service,
+                generation_mode=input_data.get("config_generation_mode", GenerationMode.TEMPLATE)
             )
             
             # Generate configuration files
@@ -766,6 +781,9 @@ class CodeAssemblerAgent(BaseAgent):
                 output_dir=self.output_dir
             )
             
+            # Index planned file paths once for per-component lookups
+            file_organizer.set_file_mappings(file_structure.get("file_mappings", []))
+            
             # Register components with the organizer
             for component_id, component_data in components.items():
                 component_name = component_data.get("name", component_id)
@@ -790,11 +808,7 @@ class CodeAssemblerAgent(BaseAgent):
                             component_type = ComponentType.TEST
                 
                 # Find file path from structure plan
-                file_path = None
-                for mapping in file_structure.get("file_mappings", []):
-                    if mapping.get("component_id") == component_id:
-                        file_path = mapping.get("file_path")
-                        break
+                file_path = file_organizer.get_planned_path(component_id)
                 
                 # Create component
                 component = Component(
@@ -821,7 +835,7 @@ class CodeAssemblerAgent(BaseAgent):
                     )
             
             # Generate documentation if not already included
-            documentation_exists = any(comp.component_type == ComponentType.DOCUMENTATION for comp in file_organizer._components)
+            documentation_exists = any(comp.component_type == ComponentType.DOCUMENTATION for comp in file_organizer.components)
             
             if not documentation_exists:
                 self.logger.info("Generating project documentation")
@@ -879,21 +893,24 @@ class CodeAssemblerAgent(BaseAgent):
                             )
                         )
             
-            # Organize and write all files
-            project_dir = file_organizer.organize_files()
+            # Organize and write all files, optionally as a single archive
+            bundle_format = input_data.get("bundle_format")
+            output_path = await file_organizer.organize_files_async(bundle_format=bundle_format)
+            project_dir = file_organizer.project_dir if bundle_format else output_path
             
             # Create compilation result
             compilation_result = {
                 "project_dir": project_dir,
+                "bundle_path": output_path if bundle_format else None,
                 "compilation_plan": compilation_plan,
-                "file_count": len(file_organizer.file_paths),
+                "file_count": len(file_organizer.path_index),
                 "component_count": len(components),
                 "compilation_timestamp": datetime.now().isoformat()
             }
             
-            # Store in state
+            # Store in state; a bundled project only exists as its archive
             state["compiled_project"] = compilation_result
-            state["output_location"] = project_dir
+            state["output_location"] = output_path
             
             # Store in working memory
             await self.memory_manager.store(
@@ -911,7 +928,7 @@ class CodeAssemblerAgent(BaseAgent):
                 memory_type=MemoryType.LONG_TERM,
                 content={
                     "project_name": self.project_name,
-                    "output_location": project_dir,
+                    "output_location": output_path,
                     "component_count": len(components),
                     "compilation_timestamp": datetime.now().isoformat()
                 },
@@ -921,7 +938,7 @@ class CodeAssemblerAgent(BaseAgent):
             # Update status for next phase
             state["status"] = "completed"
             
-            self.logger.info(f"Project compilation completed. Output at: {project_dir}")
+            self.logger.info(f"Project compilation completed. Output at: {output_path}")
             return state
             
         except Exception as e:
@@ -971,9 +988,13 @@ class CodeAssemblerAgent(BaseAgent):
                 "weaknesses": quality_assessment.get("weaknesses", [])
             }
             
-            # Write summary report to output location
-            summary_path = os.path.join(output_location, "assembly_summary.json")
+            # Write summary report to the project directory, or next to the project bundle
+            if compilation_result.get("bundle_path"):
+                summary_path = f"{compilation_result['project_dir']}_assembly_summary.json"
+            else:
+                summary_path = os.path.join(output_location, "assembly_summary.json")
             try:
+                os.makedirs(os.path.dirname(summary_path) or ".", exist_ok=True)
                 with open(summary_path, "w", encoding="utf-8") as f:
                     json.dump(summary_report, f, indent=2)
             except Exception as e:
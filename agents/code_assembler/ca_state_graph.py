@@ -20,7 +20,7 @@ class CodeAssemblerGraphState(TypedDict):
         integration_plan (Dict[str, Any]): Plan for integrating components
         compiled_project (Dict[str, Any]): Final compiled project information
         config_files (Dict[str, Any]): Generated configuration files
-        output_location (str): Location of the assembled project
+        output_location (str): Location of the assembled project directory or bundle file
         status (str): Current workflow status
     """
     input: Dict[str, Any]
@@ -666,6 +666,97 @@ def format_conflict_resolution_prompt(
         Format your response as a structured JSON object.
         """
 
+@trace_method
+def format_batch_conflict_resolution_prompt(
+    conflicts: List[Dict[str, Any]],
+    components: Dict[str, Any],
+    project_type: str
+) -> str:
+    """
+    Format prompt for resolving several independent conflicts in one request.
+    
+    Args:
+        conflicts: Conflicts to resolve, none sharing a component
+        components: Dictionary of collected components
+        project_type: Type of project being assembled
+        
+    Returns:
+        str: Formatted prompt for batched conflict resolution
+    """
+    logger.debug(f"Formatting batch conflict resolution prompt for {len(conflicts)} conflicts")
+    
+    try:
+        conflicts_text = ""
+        for index, conflict in enumerate(conflicts):
+            conflicts_text += f"CONFLICT {index}:\n"
+            conflicts_text += f"Type: {conflict.get('conflict_type', 'unknown')}\n"
+            if conflict.get("resolution"):
+                conflicts_text += f"Suggested resolution: {conflict['resolution']}\n"
+            for comp_id in conflict.get("conflicting_components", []):
+                component = components.get(comp_id, {})
+                name = component.get("name", comp_id)
+                content = str(component.get("content", ""))[:500]  # Limit content length
+                if len(content) == 500:
+                    content += "..."
+                conflicts_text += f"Component ID: {comp_id}\n"
+                conflicts_text += f"Name: {name}\n"
+                conflicts_text += f"Content:\n{content}\n"
+            conflicts_text += "\n"
+        
+        prompt = f"""
+        As a Code Assembler AI, resolve each of the following independent conflicts between components.
+        The conflicts do not share components, so resolve each one on its own.
+
+        PROJECT TYPE:
+        {project_type}
+
+        {conflicts_text}
+        For every conflict:
+        1. Analyze the specific conflict between its components
+        2. Recommend the best approach for resolving it
+        3. Provide the modified code or structure needed to implement the resolution
+
+        Format your response as a JSON object with one entry per conflict:
+        {{
+            "resolutions": [
+                {{
+                    "conflict_index": 0,
+                    "conflict_analysis": "Analysis of the conflict",
+                    "recommended_strategy": "Name of recommended strategy",
+                    "implementation": {{
+                        "modified_components": [
+                            {{
+                                "component_id": "id",
+                                "original_content": "Relevant part of original content",
+                                "modified_content": "Modified content with conflict resolved",
+                                "explanation": "Explanation of the changes"
+                            }}
+                        ],
+                        "new_components": [
+                            {{
+                                "name": "New component name",
+                                "content": "Content for the new component",
+                                "purpose": "Why this new component is needed"
+                            }}
+                        ]
+                    }}
+                }}
+            ]
+        }}
+        """
+        
+        logger.debug("Batch conflict resolution prompt formatted successfully")
+        return prompt
+        
+    except Exception as e:
+        logger.error(f"Error formatting batch conflict resolution prompt: {str(e)}", exc_info=True)
+        return f"""
+        As a Code Assembler AI, resolve each of the {len(conflicts)} conflicts between the provided components.
+        
+        Format your response as a JSON object with a "resolutions" list holding one entry per conflict,
+        each with its "conflict_index" and an "implementation".
+        """
+
 @trace_method
 def format_documentation_generation_prompt(
     components: Dict[str, Any],
@@ -12,11 +12,22 @@ from agents.code_assembler.llm.ca_prompts import (
     format_config_generation_prompt,
     format_project_compilation_prompt,
     format_conflict_resolution_prompt,
+    format_batch_conflict_resolution_prompt,
     format_documentation_generation_prompt
 )
 from core.logging.logger import setup_logger
 from core.tracing.service import trace_class
 
+# Response tokens for resolving a single conflict
+CONFLICT_RESOLUTION_MAX_TOKENS = 1500
+
+# Response tokens reserved for each conflict in a batched resolution request; a batched
+# resolution is as long as a single one, so it gets the same budget
+BATCH_CONFLICT_MAX_TOKENS = CONFLICT_RESOLUTION_MAX_TOKENS
+
+# Upper bound on the response tokens of a batched resolution request
+BATCH_RESPONSE_MAX_TOKENS = 4096
+
 @trace_class
 class CodeAssemblerLLMService:
     """
@@ -478,7 +489,7 @@ class CodeAssemblerLLMService:
         metadata={
             "operation_details": {
                 "prompt_template": "conflict_resolution",
-                "max_tokens": 1500,
+                "max_tokens": CONFLICT_RESOLUTION_MAX_TOKENS,
                 "temperature": 0.3,
                 "response_format": "structured_json"
             }
@@ -520,7 +531,7 @@ class CodeAssemblerLLMService:
                     {"role": "system", "content": "You are a Code Assembler AI with expertise in resolving conflicts between code components."},
                     {"role": "user", "content": formatted_prompt}
                 ],
-                max_tokens=1500
+                max_tokens=CONFLICT_RESOLUTION_MAX_TOKENS
             )
 
             # Parse and validate response
@@ -534,6 +545,80 @@ class CodeAssemblerLLMService:
             self.logger.error(f"Error in conflict resolution: {str(e)}", exc_info=True)
             raise
 
+    @monitor_llm(
+        run_name="resolve_conflicts_batch",
+        metadata={
+            "operation_details": {
+                "prompt_template": "batch_conflict_resolution",
+                "max_tokens_per_conflict": BATCH_CONFLICT_MAX_TOKENS,
+                "temperature": 0.3,
+                "response_format": "structured_json"
+            }
+        }
+    )
+    async def resolve_conflicts_batch(
+        self,
+        conflicts: List[Dict[str, Any]],
+        components: Dict[str, Any],
+        project_type: str
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Resolve several independent conflicts with a single request.
+        
+        The response token limit grows with the number of conflicts, up to
+        BATCH_RESPONSE_MAX_TOKENS; conflicts beyond that budget are left
+        unresolved (None) so the caller resolves them individually.
+        
+        Args:
+            conflicts: Conflicts to resolve, none sharing a component
+            components: Dictionary of collected components
+            project_type: Type of project being assembled
+            
+        Returns:
+            List[Optional[Dict[str, Any]]]: Resolution per conflict, in input order;
+            None where the response did not include one
+            
+        Raises:
+            Exception: If conflict resolution fails
+        """
+        resolutions: List[Optional[Dict[str, Any]]] = [None] * len(conflicts)
+        batch_size = max(1, BATCH_RESPONSE_MAX_TOKENS // BATCH_CONFLICT_MAX_TOKENS)
+        batch = conflicts[:batch_size]
+        self.logger.info(f"Resolving {len(batch)} of {len(conflicts)} conflicts in one batch")
+        
+        try:
+            formatted_prompt = format_batch_conflict_resolution_prompt(
+                conflicts=batch,
+                components=components,
+                project_type=project_type
+            )
+
+            response_content = await self._create_chat_completion(
+                messages=[
+                    {"role": "system", "content": "You are a Code Assembler AI with expertise in resolving conflicts between code components."},
+                    {"role": "user", "content": formatted_prompt}
+                ],
+                max_tokens=BATCH_CONFLICT_MAX_TOKENS * len(batch)
+            )
+
+            response = await self._parse_llm_response(response_content, ["resolutions"])
+            
+            entries = response.get("resolutions")
+            for position, entry in enumerate(entries if isinstance(entries, list) else []):
+                if not isinstance(entry, dict):
+                    continue
+                index = entry.get("conflict_index", position)
+                if isinstance(index, int) and 0 <= index < len(batch) and resolutions[index] is None:
+                    resolutions[index] = entry
+            
+            self.logger.info(f"Batch conflict resolution completed with "
+                             f"{sum(r is not None for r in resolutions)}/{len(conflicts)} resolutions")
+            return resolutions
+            
+        except Exception as e:
+            self.logger.error(f"Error in batch conflict resolution: {str(e)}", exc_info=True)
+            raise
+
     @monitor_llm(
         run_name="generate_documentation",
         metadata={
@@ -1,15 +1,24 @@
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Dict, Any
+import uuid
+from typing import Dict, Any, Optional
 from core.logging.logger import setup_logger
 from core.tracing.service import  trace_class
 from memory.memory_manager import MemoryManager
 from memory.base import MemoryType
+from agents.core.graph.checkpointing import (
+    CHECKPOINT_RETAIN_COMPLETED, setup_checkpointer, make_run_config, delete_thread
+)
+from agents.core.graph.graph_builder import RUN_AGENT_KEY
+from agents.core.graph.graph_cache import graph_cache
 
 @trace_class
 class BaseAgent(ABC):
     """Abstract base class for all agents."""
     
+    # Version of the agent's workflow graph; bump when its topology changes
+    GRAPH_VERSION = "1"
+    
     def __init__(self, agent_id: str, name: str, memory_manager: MemoryManager):
         self.logger = setup_logger(f"base_agent.{name.lower()}")
         self.logger.info(f"Initializing base agent: {name} (ID: {agent_id})")
@@ -20,6 +29,7 @@ class BaseAgent(ABC):
             self.created_at = datetime.utcnow()
             self.status = "initialized"
             self.memory_manager = memory_manager
+            self.last_thread_id: Optional[str] = None  # Thread of the latest graph run, for resuming it
             self.logger.info("Base agent initialization completed")
             
         except Exception as e:
@@ -68,6 +78,66 @@ class BaseAgent(ABC):
             self.logger.error(f"Failed to update status: {str(e)}", exc_info=True)
             raise
 
+    def _get_compiled_graph(self):
+        """
+        Get the agent type's compiled workflow graph from the process-wide cache.
+
+        The graph is built with this instance's _build_graph on first use and
+        shared by later instances of the same agent type and GRAPH_VERSION.
+        """
+        agent_type = f"{type(self).__module__}.{type(self).__qualname__}"
+        return graph_cache.get_or_build(agent_type, self.GRAPH_VERSION, self._build_graph)
+
+    async def invoke_graph(
+        self,
+        initial_state: Optional[Dict[str, Any]],
+        thread_id: Optional[str] = None,
+        resume: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Run the agent's compiled workflow graph under a checkpointed thread.
+
+        State is checkpointed after every node, so a run that fails or is
+        interrupted can be resumed from its last completed node by calling
+        again with the same thread_id and resume=True. The thread_id of the
+        latest run is kept in last_thread_id and added as a note to any
+        exception the run raises. Checkpoints of runs that complete are
+        deleted unless VITA_CHECKPOINT_RETAIN_COMPLETED is set.
+
+        Args:
+            initial_state: Initial graph state (ignored when resuming)
+            thread_id: Identifier of the run; a new one is generated if omitted
+            resume: Whether to continue the thread from its last checkpoint
+
+        Returns:
+            Dict[str, Any]: Final graph state
+        """
+        thread_id = thread_id or f"{self.agent_id}_{uuid.uuid4().hex}"
+        run_config = make_run_config(thread_id, **{RUN_AGENT_KEY: self})
+        self.last_thread_id = thread_id
+
+        await setup_checkpointer()
+
+        try:
+            if resume:
+                self.logger.info(f"Resuming workflow from last checkpoint (thread_id={thread_id})")
+                result = await self.graph.ainvoke(None, run_config)
+            else:
+                self.logger.info(f"Starting workflow (thread_id={thread_id})")
+                result = await self.graph.ainvoke(initial_state, run_config)
+        except Exception as e:
+            e.add_note(f"Resume with thread_id={thread_id} and resume=True")
+            raise
+
+        # Retention: a completed thread has nothing left to resume
+        checkpointer = getattr(self.graph, "checkpointer", None)
+        if not CHECKPOINT_RETAIN_COMPLETED and checkpointer:
+            snapshot = await self.graph.aget_state(run_config)
+            if not snapshot.next:
+                await delete_thread(thread_id, checkpointer)
+
+        return result
+
     @abstractmethod
     async def run(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
         """Execute the agent's workflow."""
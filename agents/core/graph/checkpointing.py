@@ -0,0 +1,216 @@
+import os
+import asyncio
+import weakref
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+from core.logging.logger import setup_logger
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+
+logger = setup_logger("core.graph.checkpointing")
+
+# Root of the project, used to anchor relative checkpoint paths
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+
+# Backend selection: "sqlite" (default), "postgres", "memory" or "none"
+CHECKPOINT_BACKEND = os.getenv("VITA_CHECKPOINT_BACKEND", "sqlite").lower()
+
+# SQLite checkpoint database; relative paths are resolved against the project root, not the CWD
+CHECKPOINT_DB_PATH = str(PROJECT_ROOT / os.getenv("VITA_CHECKPOINT_DB_PATH", os.path.join("data", "checkpoints.db")))
+
+# Keep the checkpoints of runs that completed; by default only failed or interrupted runs are kept for resuming
+CHECKPOINT_RETAIN_COMPLETED = os.getenv("VITA_CHECKPOINT_RETAIN_COMPLETED", "false").lower() == "true"
+
+class CheckpointSerializer(JsonPlusSerializer):
+    """
+    Checkpoint serializer that refuses state it cannot restore faithfully.
+
+    Only values msgpack can encode are checkpointed; arbitrary objects are
+    never pickled. An unserializable value fails the run with a TypeError
+    naming it, rather than being stored in a form that would come back
+    different when the run is resumed.
+    """
+
+    def __init__(self):
+        super().__init__(pickle_fallback=False)
+
+    def dumps_typed(self, obj: Any) -> Tuple[str, bytes]:
+        try:
+            return super().dumps_typed(obj)
+        except TypeError as e:
+            logger.error(f"Cannot checkpoint graph state: {str(e)}")
+            raise TypeError(f"Graph state cannot be checkpointed: {str(e)}") from e
+
+# Optional checkpoint saver backends
+try:
+    import aiosqlite
+    from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+    HAS_SQLITE_SAVER = True
+except ImportError:
+    HAS_SQLITE_SAVER = False
+
+if HAS_SQLITE_SAVER:
+    class DeferredAsyncSqliteSaver(AsyncSqliteSaver):
+        """
+        AsyncSqliteSaver that binds to the event loop on first use.
+
+        Agents compile their graphs in __init__, which may run before any
+        event loop exists, while AsyncSqliteSaver captures the running loop
+        at construction. Without a running loop, the base initializer runs
+        in a short-lived loop and the saver is bound again in setup.
+        """
+
+        def __init__(self, conn: "aiosqlite.Connection", **kwargs):
+            try:
+                asyncio.get_running_loop()
+                super().__init__(conn, **kwargs)
+            except RuntimeError:
+                async def initialize() -> None:
+                    AsyncSqliteSaver.__init__(self, conn, **kwargs)
+
+                init_loop = asyncio.new_event_loop()
+                try:
+                    init_loop.run_until_complete(initialize())
+                finally:
+                    init_loop.close()
+            self.loop = None
+
+        async def setup(self) -> None:
+            if self.loop is None:
+                self.loop = asyncio.get_running_loop()
+            await super().setup()
+
+try:
+    from psycopg_pool import AsyncConnectionPool
+    from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver
+    HAS_POSTGRES_SAVER = True
+except ImportError:
+    HAS_POSTGRES_SAVER = False
+
+from langgraph.checkpoint.memory import MemorySaver
+
+_checkpointer = None
+_checkpointer_ready = False
+_setup_locks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]" = weakref.WeakKeyDictionary()
+
+def _create_checkpointer():
+    """Create the checkpoint saver for the configured backend."""
+    if CHECKPOINT_BACKEND == "none":
+        logger.info("Graph checkpointing disabled")
+        return None
+
+    if CHECKPOINT_BACKEND == "postgres":
+        if HAS_POSTGRES_SAVER:
+            from backend.config import config
+            pool = AsyncConnectionPool(
+                conninfo=config.database_url(),
+                max_size=10,
+                open=False,
+                kwargs={"autocommit": True, "prepare_threshold": 0}
+            )
+            logger.info("Using Postgres checkpoint saver")
+            return AsyncPostgresSaver(pool, serde=CheckpointSerializer())
+        logger.warning("langgraph-checkpoint-postgres not available, falling back to SQLite checkpoints")
+
+    if CHECKPOINT_BACKEND in ("sqlite", "postgres"):
+        if HAS_SQLITE_SAVER:
+            os.makedirs(os.path.dirname(CHECKPOINT_DB_PATH), exist_ok=True)
+            logger.info(f"Using SQLite checkpoint saver at {CHECKPOINT_DB_PATH}")
+            return DeferredAsyncSqliteSaver(aiosqlite.connect(CHECKPOINT_DB_PATH), serde=CheckpointSerializer())
+        logger.warning("langgraph-checkpoint-sqlite not available, falling back to in-memory checkpoints")
+
+    logger.info("Using in-memory checkpoint saver")
+    return MemorySaver(serde=CheckpointSerializer())
+
+def get_checkpointer():
+    """
+    Get the process-wide checkpoint saver used when compiling agent graphs.
+
+    Returns:
+        The checkpoint saver, or None if checkpointing is disabled
+    """
+    global _checkpointer
+    if _checkpointer is None and CHECKPOINT_BACKEND != "none":
+        _checkpointer = _create_checkpointer()
+    return _checkpointer
+
+async def setup_checkpointer() -> None:
+    """Open connections and create checkpoint tables for the saver, once per process."""
+    global _checkpointer_ready
+    if _checkpointer_ready:
+        return
+
+    # asyncio locks belong to one event loop, so each loop gets its own
+    loop = asyncio.get_running_loop()
+    setup_lock = _setup_locks.get(loop)
+    if setup_lock is None:
+        setup_lock = _setup_locks[loop] = asyncio.Lock()
+
+    async with setup_lock:
+        if _checkpointer_ready:
+            return
+
+        checkpointer = get_checkpointer()
+        if HAS_POSTGRES_SAVER and isinstance(checkpointer, AsyncPostgresSaver):
+            await checkpointer.conn.open()
+            await checkpointer.setup()
+        elif HAS_SQLITE_SAVER and isinstance(checkpointer, AsyncSqliteSaver):
+            await checkpointer.setup()
+
+        _checkpointer_ready = True
+        logger.debug("Checkpoint saver ready")
+
+async def close_checkpointer() -> None:
+    """
+    Close the checkpoint saver's connections.
+
+    Every entry point must await this at shutdown: an open SQLite saver
+    keeps a non-daemon connection thread alive, which stops the process
+    from exiting.
+    """
+    global _checkpointer, _checkpointer_ready
+    checkpointer = _checkpointer
+    if checkpointer is None:
+        return
+
+    try:
+        if HAS_POSTGRES_SAVER and isinstance(checkpointer, AsyncPostgresSaver):
+            await checkpointer.conn.close()
+        elif HAS_SQLITE_SAVER and isinstance(checkpointer, AsyncSqliteSaver):
+            await checkpointer.conn.close()
+        logger.info("Closed checkpoint saver")
+    except Exception as e:
+        logger.error(f"Error closing checkpoint saver: {str(e)}", exc_info=True)
+    finally:
+        _checkpointer = None
+        _checkpointer_ready = False
+
+async def delete_thread(thread_id: str, checkpointer: Optional[Any] = None) -> None:
+    """
+    Delete all checkpoints stored for a thread.
+
+    Args:
+        thread_id: Identifier of the run whose checkpoints to delete
+        checkpointer: Saver holding the checkpoints; defaults to the process-wide saver
+    """
+    checkpointer = checkpointer or get_checkpointer()
+    if checkpointer is None:
+        return
+
+    try:
+        await checkpointer.adelete_thread(thread_id)
+        logger.debug(f"Deleted checkpoints for thread {thread_id}")
+    except Exception as e:
+        logger.error(f"Error deleting checkpoints for thread {thread_id}: {str(e)}", exc_info=True)
+
+def make_run_config(thread_id: str, **configurable) -> Dict[str, Any]:
+    """
+    Build the LangGraph run configuration for a checkpointed thread.
+
+    Args:
+        thread_id: Identifier of the run whose checkpoints to use
+        **configurable: Additional configurable values for the run
+
+    Returns:
+        Dict[str, Any]: Run configuration for ainvoke
+    """
+    return {"configurable": {"thread_id": thread_id, **configurable}}
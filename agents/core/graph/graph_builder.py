@@ -1,66 +1,279 @@
-from langgraph.graph import StateGraph
-from typing import Any, Set, List, Tuple, Callable
+import inspect
+import weakref
+from langgraph.graph import StateGraph, END
+from langchain_core.runnables import RunnableConfig
+from typing import Annotated, Any, Dict, Set, List, Tuple, Callable, Optional, Union, get_type_hints
+from typing_extensions import TypedDict
 from core.logging.logger import setup_logger
 
 logger = setup_logger("core.graph.builder")
 
+# Key in a run's configurable dict holding the agent that node handlers run on
+RUN_AGENT_KEY = "agent"
+
+# State reducers for keys written by parallel branches in the same step
+
+def take_last(left: Any, right: Any) -> Any:
+    """Keep the most recent value."""
+    return right
+
+def merge_dicts(left: Optional[Dict[str, Any]], right: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Shallow-merge dictionaries, with later values overriding earlier ones."""
+    if left is None or right is None:
+        return right
+    return {**left, **right}
+
+def _dispatch_to_run_agent(method: Callable) -> Callable:
+    """
+    Wrap a bound agent method so it runs on the agent invoking the graph.
+
+    Compiled graphs are shared between instances of an agent type, so the
+    handler is looked up by name on the agent passed in the run config.
+    The instance that built the graph is only a weakly held fallback for
+    runs invoked without one.
+    """
+    method_name = method.__name__
+    owner_ref = weakref.ref(method.__self__)
+
+    def resolve(config: RunnableConfig) -> Callable:
+        agent = (config or {}).get("configurable", {}).get(RUN_AGENT_KEY) or owner_ref()
+        if agent is None:
+            raise RuntimeError(f"No agent available to run node handler '{method_name}'")
+        return getattr(agent, method_name)
+
+    if inspect.iscoroutinefunction(method):
+        async def node(state: Any, config: RunnableConfig) -> Any:
+            return await resolve(config)(state)
+    else:
+        def node(state: Any, config: RunnableConfig) -> Any:
+            return resolve(config)(state)
+
+    node.__name__ = method_name
+    return node
+
+def _changed_keys_only(func: Callable) -> Callable:
+    """
+    Wrap a node handler so it only writes the state keys it changed.
+
+    Handlers return the whole state dict; writing back unchanged keys would
+    make parallel branches collide on every key in the same step. Results
+    are compared against a shallow snapshot of the state taken before the
+    handler runs: a key still holding the same object is unchanged, and a
+    replaced value is only written if it compares unequal. Values mutated
+    in place are the channel's own objects, so the change is already in
+    the state without being written back.
+    """
+    def snapshot(state: Any) -> Any:
+        return dict(state) if isinstance(state, dict) else None
+
+    def unchanged(before: Dict[str, Any], key: str, value: Any) -> bool:
+        if key not in before:
+            return False
+        if before[key] is value:
+            return True
+        try:
+            return bool(before[key] == value)
+        except Exception:
+            return False
+
+    def diff(before: Any, result: Any) -> Any:
+        if not isinstance(result, dict) or before is None:
+            return result
+        return {k: v for k, v in result.items() if not unchanged(before, k, v)}
+
+    if inspect.iscoroutinefunction(func):
+        async def node(state: Any, config: RunnableConfig) -> Any:
+            before = snapshot(state)
+            return diff(before, await func(state, config))
+    else:
+        def node(state: Any, config: RunnableConfig) -> Any:
+            before = snapshot(state)
+            return diff(before, func(state, config))
+
+    node.__name__ = getattr(func, "__name__", "node")
+    return node
+
+def _accepts_config(func: Callable) -> bool:
+    """Check whether a handler takes the run config as a second argument."""
+    try:
+        return "config" in inspect.signature(func).parameters
+    except (TypeError, ValueError):
+        return False
+
+def _with_config(func: Callable) -> Callable:
+    """Adapt a state-only handler to the (state, config) calling convention."""
+    if inspect.ismethod(func):
+        return _dispatch_to_run_agent(func)
+    if _accepts_config(func):
+        return func
+    if inspect.iscoroutinefunction(func):
+        async def node(state: Any, config: RunnableConfig) -> Any:
+            return await func(state)
+    else:
+        def node(state: Any, config: RunnableConfig) -> Any:
+            return func(state)
+    node.__name__ = getattr(func, "__name__", "node")
+    return node
+
 class WorkflowGraphBuilder:
-    """Helper class to capture graph structure before compilation."""
-    
-    def __init__(self, state_type):
+    """
+    Helper class to capture graph structure before compilation.
+
+    Edges may carry a condition. A node with conditional out-edges routes to
+    every target whose condition holds, running them in parallel (fan-out);
+    its unconditional edges are followed only when no condition matches.
+    add_parallel_branches adds an explicit fan-out with a fan-in node that
+    waits for all branches. Keys that parallel branches may both write need
+    a reducer, and max_concurrency caps how many nodes run at once.
+    """
+
+    def __init__(
+        self,
+        state_type,
+        reducers: Optional[Dict[str, Callable[[Any, Any], Any]]] = None,
+        max_concurrency: Optional[int] = None
+    ):
         """
         Initialize the graph builder.
-        
+
         Args:
             state_type: The type definition for the graph state
+            reducers: Optional functions merging concurrent writes, per state key
+            max_concurrency: Optional cap on nodes executing at the same time
         """
-        self.graph = StateGraph(state_type)
+        self.state_type = state_type
+        self.reducers = reducers or {}
+        self.max_concurrency = max_concurrency
+        self.graph = StateGraph(self._with_reducers(state_type, self.reducers))
         self.nodes: Set[str] = set()
         self.edges: List[Tuple[str, str]] = []
+        self._plain_edges: List[Tuple[Union[str, List[str]], str]] = []
+        self._conditional_edges: Dict[str, List[Tuple[str, Callable]]] = {}
         logger.debug(f"Initialized WorkflowGraphBuilder with state type: {state_type.__name__}")
-        
+
+    @staticmethod
+    def _with_reducers(state_type, reducers: Dict[str, Callable[[Any, Any], Any]]):
+        """Derive a state schema whose keys carry the given reducers."""
+        if not reducers:
+            return state_type
+
+        hints = get_type_hints(state_type)
+        unknown = set(reducers) - set(hints)
+        if unknown:
+            raise ValueError(f"Reducers given for unknown state keys: {sorted(unknown)}")
+
+        fields = {
+            key: Annotated[hint, reducers[key]] if key in reducers else hint
+            for key, hint in hints.items()
+        }
+        return TypedDict(state_type.__name__, fields, total=getattr(state_type, "__total__", True))
+
     def add_node(self, name: str, func: Callable, **kwargs) -> None:
         """
         Add node and track it.
-        
+
+        Bound agent methods are dispatched to the agent running the graph,
+        so the compiled graph can be shared between agent instances.
+
         Args:
             name: Name of the node
             func: Function to execute at this node
             **kwargs: Additional arguments for the node
         """
-        self.graph.add_node(name, func, **kwargs)
+        self.graph.add_node(name, _changed_keys_only(_with_config(func)), **kwargs)
         self.nodes.add(name)
         logger.debug(f"Added node: {name}")
-        
-    def add_edge(self, start: str, end: str, **kwargs) -> None:
+
+    def add_edge(self, start: Union[str, List[str]], end: str, condition: Optional[Callable] = None) -> None:
         """
         Add edge and track it.
-        
+
+        Conditions that are bound agent methods are dispatched to the agent
+        running the graph, like node handlers. Any other condition must not
+        capture an agent instance, since the compiled graph is shared.
+
         Args:
-            start: Starting node name
-            end: Ending node name
-            **kwargs: Additional arguments for the edge
+            start: Starting node name, or a list of nodes that must all finish first
+            end: Ending node name ('end' finishes the workflow)
+            condition: Optional predicate on the state for taking this edge
         """
-        self.graph.add_edge(start, end, **kwargs)
-        self.edges.append((start, end))
-        logger.debug(f"Added edge: {start} -> {end}")
-        
+        if end == "end" and "end" not in self.nodes:
+            end = END
+
+        if condition is not None:
+            if not isinstance(start, str):
+                raise ValueError("Conditional edges must start from a single node")
+            self._conditional_edges.setdefault(start, []).append((end, _with_config(condition)))
+        else:
+            self._plain_edges.append((start, end))
+
+        for source in ([start] if isinstance(start, str) else start):
+            self.edges.append((source, end))
+        logger.debug(f"Added edge: {start} -> {end}{' (conditional)' if condition else ''}")
+
+    def add_parallel_branches(self, start: str, branches: Dict[str, Callable], join: str) -> None:
+        """
+        Fan out from a node into branches that run concurrently, then fan in.
+
+        The join node runs once, after every branch has finished and their
+        updates have been merged into the state.
+
+        Args:
+            start: Node the branches start from
+            branches: Branch node names mapped to their handlers
+            join: Node to continue with once all branches are done
+        """
+        for name, func in branches.items():
+            self.add_node(name, func)
+            self.add_edge(start, name)
+        self.add_edge(list(branches), join)
+        logger.debug(f"Added parallel branches from {start}: {list(branches)} -> {join}")
+
     def set_entry_point(self, node: str) -> None:
         """
         Set the entry point.
-        
+
         Args:
             node: Name of the entry point node
         """
         self.graph.set_entry_point(node)
         logger.debug(f"Set entry point to: {node}")
-        
-    def compile(self) -> StateGraph:
+
+    def _make_router(self, source: str, conditions: List[Tuple[str, Callable]], defaults: List[str]) -> Callable:
+        """Build the routing function for a node with conditional out-edges."""
+        def route(state: Any, config: RunnableConfig) -> List[str]:
+            targets = [target for target, condition in conditions if condition(state, config)]
+            if not targets:
+                targets = defaults or [END]
+            if len(targets) > 1:
+                logger.debug(f"Fanning out from {source} to {targets}")
+            return targets
+        return route
+
+    def compile(self, checkpointer: Any = None, **kwargs) -> StateGraph:
         """
         Return compiled graph.
-        
+
+        Args:
+            checkpointer: Optional checkpoint saver used to persist state after each node
+            **kwargs: Additional arguments for compilation
+
         Returns:
             StateGraph: The compiled graph ready for execution
         """
-        logger.info("Compiling graph")
-        return self.graph.compile()
\ No newline at end of file
+        for start, end in self._plain_edges:
+            if isinstance(start, str) and start in self._conditional_edges:
+                continue
+            self.graph.add_edge(start, end)
+
+        for source, conditions in self._conditional_edges.items():
+            defaults = [end for start, end in self._plain_edges if start == source]
+            path_map = list(dict.fromkeys([target for target, _ in conditions] + defaults + [END]))
+            self.graph.add_conditional_edges(source, self._make_router(source, conditions, defaults), path_map)
+
+        logger.info(f"Compiling graph (checkpointing={'enabled' if checkpointer is not None else 'disabled'}, "
+                    f"max_concurrency={self.max_concurrency})")
+        compiled_graph = self.graph.compile(checkpointer=checkpointer, **kwargs)
+        if self.max_concurrency:
+            compiled_graph = compiled_graph.with_config(max_concurrency=self.max_concurrency)
+        return compiled_graph
@@ -0,0 +1,71 @@
+import threading
+from typing import Any, Callable, Dict, Tuple
+from core.logging.logger import setup_logger
+from agents.core.graph.checkpointing import get_checkpointer
+
+logger = setup_logger("core.graph.cache")
+
+class CompiledGraphCache:
+    """
+    Process-wide cache of compiled agent workflow graphs.
+
+    Graphs are keyed by agent type and graph version. Node handlers dispatch
+    to the agent passed in each run's config (see WorkflowGraphBuilder), so a
+    single compiled topology is shared by every instance of an agent type
+    while per-run state stays with the instance that invoked it.
+    """
+
+    def __init__(self):
+        self._graphs: Dict[Tuple[str, str], Tuple[Any, Any]] = {}  # key -> (checkpointer, compiled graph)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_build(self, agent_type: str, version: str, build_fn: Callable[[], Any]) -> Any:
+        """
+        Get the compiled graph for an agent type, building it on first use.
+
+        Args:
+            agent_type: Fully qualified agent class name
+            version: Graph version; bump it when an agent's topology changes
+            build_fn: Function that builds and compiles the graph
+
+        Returns:
+            The compiled graph
+        """
+        key = (agent_type, version)
+        checkpointer = get_checkpointer()
+
+        with self._lock:
+            entry = self._graphs.get(key)
+            # A graph compiled against a closed checkpoint saver must be rebuilt
+            if entry is not None and entry[0] is checkpointer:
+                self.hits += 1
+                return entry[1]
+
+            self.misses += 1
+            logger.info(f"Compiling graph for {agent_type} (version {version})")
+            compiled_graph = build_fn()
+            self._graphs[key] = (checkpointer, compiled_graph)
+            return compiled_graph
+
+    def invalidate(self, agent_type: str = None) -> None:
+        """Drop cached graphs for one agent type, or all of them."""
+        with self._lock:
+            if agent_type is None:
+                self._graphs.clear()
+            else:
+                for key in [k for k in self._graphs if k[0] == agent_type]:
+                    del self._graphs[key]
+        logger.info(f"Invalidated cached graphs for {agent_type or 'all agent types'}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        return {
+            "cached_graphs": len(self._graphs),
+            "hits": self.hits,
+            "misses": self.misses
+        }
+
+# Create singleton instance
+graph_cache = CompiledGraphCache()
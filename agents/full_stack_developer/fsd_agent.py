@@ -1,18 +1,23 @@
 from typing import Dict, List, Any, Optional
+import asyncio
 import json
+import os
 from datetime import datetime
 from langgraph.graph import StateGraph
 from core.logging.logger import setup_logger
 from agents.core.monitoring.decorators import monitor_operation
 from agents.core.base_agent import BaseAgent
+from agents.core.graph.checkpointing import get_checkpointer
 from agents.core.graph.graph_builder import WorkflowGraphBuilder
 from memory.memory_manager import MemoryManager
-from memory.base import MemoryType
+from memory.base import MemoryType, DeliverableType
 from .fsd_state_graph import FullStackDeveloperGraphState, validate_state, get_next_stage, get_coordination_state, can_process_teamlead_message
 from .llm.fsd_service import LLMService
 from tools.full_stack_developer.requirement_analyzer import analyze_requirements
 from tools.full_stack_developer.solution_designer import design_solution
 from tools.full_stack_developer.code_generator import generate_code
+from tools.full_stack_developer.generation_manifest import GenerationManifest
+from core.utils.output_writer import session_output_dir
 from tools.full_stack_developer.documentation_generator import generate_documentation
 
 class FullStackDeveloperAgent(BaseAgent):
@@ -26,8 +31,8 @@ class FullStackDeveloperAgent(BaseAgent):
         try:
             self.llm_service = LLMService()
             
-            # Build the processing graph
-            self.graph = self._build_graph()
+            # Get the shared compiled processing graph
+            self.graph = self._get_compiled_graph()
             self.logger.info("FullStackDeveloperAgent initialization completed")
             
         except Exception as e:
@@ -90,7 +95,7 @@ class FullStackDeveloperAgent(BaseAgent):
             builder.set_entry_point("start")
             
             # Compile graph
-            compiled_graph = builder.compile()
+            compiled_graph = builder.compile(checkpointer=get_checkpointer())
             self.logger.info("Successfully built and compiled graph")
             
             return compiled_graph
@@ -506,6 +511,10 @@ class FullStackDeveloperAgent(BaseAgent):
             # Check if this is a Team Lead instruction
             is_team_lead_instruction = "task_id" in input_data and "team_lead_id" in input_data
             
+            # Output is kept per session (or per run without one), so concurrent runs never share a directory
+            session_id = input_data.get("session_id") or (input_data.get("context") or {}).get("session_id")
+            output_dir = input_data.get("output_dir") or session_output_dir(session_id)
+            
             # Create initial state based on input type
             initial_state = {
                 "input": input_data["input"],
@@ -514,6 +523,7 @@ class FullStackDeveloperAgent(BaseAgent):
                 "generated_code": {},
                 "documentation": {},
                 "status": "initialized",
+                "output_dir": output_dir,
                 "deliverables": {},
                 "feedback": [],
                 "revision_requests": [],
@@ -536,7 +546,11 @@ class FullStackDeveloperAgent(BaseAgent):
             
             # Execute graph
             self.logger.debug("Starting graph execution")
-            result = await self.graph.ainvoke(initial_state)
+            result = await self.invoke_graph(
+                initial_state,
+                thread_id=input_data.get("thread_id"),
+                resume=input_data.get("resume", False)
+            )
             
             self.logger.info("Workflow completed successfully")
             return result
@@ -836,13 +850,16 @@ class FullStackDeveloperAgent(BaseAgent):
             task_specification = state["input"]
             requirements = state["requirements"]
             solution_design = state["solution_design"]
+            output_dir = state.get("output_dir") or session_output_dir()
             
             # Generate code using the tool
+            # Only regenerate components whose inputs changed since the last run
             generated_code = await generate_code(
                 task_specification=task_specification,
                 requirements=requirements,
                 solution_design=solution_design,
-                llm_service=self.llm_service
+                llm_service=self.llm_service,
+                manifest=await asyncio.to_thread(GenerationManifest.load, output_dir)
             )
             
             file_count = sum(len(files) for files in generated_code.values())
@@ -882,6 +899,17 @@ class FullStackDeveloperAgent(BaseAgent):
                 }
             )
             
+            # Keep the generated files as a deliverable of the session; their content goes to the
+            # artifact store and the memory entry holds references to it
+            await self.memory_manager.store_deliverable(
+                agent_id=self.agent_id,
+                deliverable_type=DeliverableType.CODE,
+                content={"generated_code": generated_code},
+                project_id=os.path.basename(output_dir),
+                task_id=state.get("task_id"),
+                metadata={"phase": "code_generation", "file_count": file_count}
+            )
+            
             # Update state with generated code and status
             state["generated_code"] = generated_code
             state["status"] = "preparing_documentation"
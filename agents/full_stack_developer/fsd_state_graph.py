@@ -18,6 +18,7 @@ class FullStackDeveloperGraphState(TypedDict):
         generated_code: Code generated for each component
         documentation: Generated documentation
         status: Current workflow status
+        output_dir: Directory where this run's generated output and manifest are kept
         
         # New fields for Team Lead coordination
         task_id: ID of the assigned task from Team Lead
@@ -35,6 +36,7 @@ class FullStackDeveloperGraphState(TypedDict):
     generated_code: Dict[str, Dict[str, str]]
     documentation: Dict[str, str]
     status: str
+    output_dir: str
     
     # New fields for Team Lead coordination
     task_id: Optional[str]
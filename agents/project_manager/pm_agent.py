@@ -5,6 +5,8 @@ from langgraph.graph import StateGraph
 from core.logging.logger import setup_logger
 from agents.core.monitoring.decorators import monitor_operation
 from agents.core.base_agent import BaseAgent
+from agents.core.graph.graph_builder import WorkflowGraphBuilder
+from agents.core.graph.checkpointing import get_checkpointer
 from agents.project_manager.llm.pm_service import LLMService
 from memory.memory_manager import MemoryManager
 from memory.base import MemoryType
@@ -26,8 +28,8 @@ class ProjectManagerAgent(BaseAgent):
         try:
             self.llm_service = LLMService()
             
-            # Build the processing graph
-            self.graph = self._build_graph()
+            # Get the shared compiled processing graph
+            self.graph = self._get_compiled_graph()
             self.logger.info("ProjectManagerAgent initialization completed")
             
         except Exception as e:
@@ -38,8 +40,8 @@ class ProjectManagerAgent(BaseAgent):
         """Build the LangGraph-based execution flow."""
         self.logger.info("Building ProjectManager processing graph")
         try:
-            # Initialize graph
-            graph = StateGraph(ProjectManagerGraphState)
+            # Initialize graph builder
+            graph = WorkflowGraphBuilder(ProjectManagerGraphState)
             
             # Add nodes
             self.logger.debug("Adding graph nodes")
@@ -56,7 +58,7 @@ class ProjectManagerAgent(BaseAgent):
             graph.set_entry_point("start")
             
             # Compile graph
-            compiled_graph = graph.compile()
+            compiled_graph = graph.compile(checkpointer=get_checkpointer())
             self.logger.info("Successfully built and compiled graph")
             
             return compiled_graph
@@ -73,10 +75,10 @@ class ProjectManagerAgent(BaseAgent):
             
             # Execute graph
             self.logger.debug("Starting graph execution")
-            result = await self.graph.ainvoke({
+            result = await self.invoke_graph({
                 "input": input_data.get("input"),
                 "status": input_data.get("status", "initialized")
-            })
+            }, thread_id=input_data.get("thread_id"), resume=input_data.get("resume", False))
             
             self.logger.info("Workflow completed successfully")
             self.logger.debug(f"Workflow result: {result}")
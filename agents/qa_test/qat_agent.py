@@ -5,6 +5,8 @@ from langgraph.graph import StateGraph
 from core.logging.logger import setup_logger
 from agents.core.monitoring.decorators import monitor_operation
 from agents.core.base_agent import BaseAgent
+from agents.core.graph.graph_builder import WorkflowGraphBuilder
+from agents.core.graph.checkpointing import get_checkpointer
 from memory.memory_manager import MemoryManager
 from memory.base import MemoryType
 from .qat_state_graph import QATestGraphState, validate_state, get_next_stage, get_priority_factor, format_status_report
@@ -27,8 +29,8 @@ class QATestAgent(BaseAgent):
         try:
             self.llm_service = QATestLLMService()
             
-            # Build the processing graph
-            self.graph = self._build_graph()
+            # Get the shared compiled processing graph
+            self.graph = self._get_compiled_graph()
             self.logger.info("QATestAgent initialization completed")
             
         except Exception as e:
@@ -39,8 +41,8 @@ class QATestAgent(BaseAgent):
         """Build the LangGraph-based execution flow with Team Lead coordination."""
         self.logger.info("Building QATest processing graph")
         try:
-            # Initialize graph
-            graph = StateGraph(QATestGraphState)
+            # Initialize graph builder
+            graph = WorkflowGraphBuilder(QATestGraphState)
             
             # Add nodes for core testing workflow
             self.logger.debug("Adding core testing nodes")
@@ -87,7 +89,7 @@ class QATestAgent(BaseAgent):
             graph.set_entry_point("start")
             
             # Compile graph
-            compiled_graph = graph.compile()
+            compiled_graph = graph.compile(checkpointer=get_checkpointer())
             self.logger.info("Successfully built and compiled graph with Team Lead coordination")
             
             return compiled_graph
@@ -140,7 +142,7 @@ class QATestAgent(BaseAgent):
             
             # Execute graph with enhanced state
             self.logger.debug("Starting graph execution with Team Lead coordination")
-            result = await self.graph.ainvoke({
+            result = await self.invoke_graph({
                 "input": input_data.get("input", ""),
                 "code": input_data.get("code", {}),
                 "specifications": input_data.get("specifications", {}),
@@ -161,7 +163,7 @@ class QATestAgent(BaseAgent):
                 "feedback": input_data.get("feedback", {}),
                 
                 "status": "receiving_task" if task_id else "initialized"
-            })
+            }, thread_id=input_data.get("thread_id"), resume=input_data.get("resume", False))
             
             self.logger.info("Workflow completed successfully")
             self.logger.debug(f"Workflow result: {result}")
@@ -8,6 +8,7 @@ import logging
 from core.logging.logger import setup_logger
 from core.tracing.service import trace_method, trace_class
 from agents.core.base_agent import BaseAgent
+from agents.core.graph.checkpointing import get_checkpointer
 from agents.scrum_master.llm.sm_service import ScrumMasterLLMService
 from agents.scrum_master.sm_state_graph import (
     ScrumMasterGraphState, RequestType, FeedbackType, UserTechnicalLevel, 
@@ -33,6 +34,7 @@ from tools.team_lead.agent_communicator import (
     AgentCommunicator, MessageType, MessagePriority, 
     DeliverableType, UserFeedbackType
 )
+from tools.team_lead.message_bus import MessageBus
 
 from memory.memory_manager import MemoryManager
 from memory.base import MemoryType
@@ -75,8 +77,8 @@ class ScrumMasterAgent(BaseAgent):
             # Initialize LLM service
             self.llm_service = ScrumMasterLLMService()
             
-            # Initialize communication tools
-            self.agent_communicator = AgentCommunicator()
+            # Initialize communication tools with push-based delivery
+            self.agent_communicator = AgentCommunicator(message_bus=MessageBus())
             
             # Register self with agent communicator
             self.agent_communicator.register_agent(agent_id)
@@ -86,8 +88,8 @@ class ScrumMasterAgent(BaseAgent):
             self.user_preferences = {}
             self.active_conversations = {}
             
-            # Build the processing graph
-            self.graph = self._build_graph()
+            # Get the shared compiled processing graph
+            self.graph = self._get_compiled_graph()
             self.logger.info("ScrumMasterAgent initialization completed")
             
         except Exception as e:
@@ -153,7 +155,7 @@ class ScrumMasterAgent(BaseAgent):
             builder.add_edge("process_feedback", "route_to_team_lead", 
                              condition=self._should_forward_feedback)
             builder.add_edge("process_feedback", "present_to_user", 
-                             condition=lambda s: not self._should_forward_feedback(s))
+                             condition=self._should_keep_feedback)
             
             # Milestone edges
             builder.add_edge("prepare_milestone", "awaiting_milestone_approval")
@@ -176,7 +178,7 @@ class ScrumMasterAgent(BaseAgent):
             builder.set_entry_point("receive_user_input")
             
             # Compile graph
-            compiled_graph = builder.compile()
+            compiled_graph = builder.compile(checkpointer=get_checkpointer())
             self.logger.info("Successfully built and compiled graph")
             
             return compiled_graph
@@ -236,6 +238,10 @@ class ScrumMasterAgent(BaseAgent):
             Priority.HIGH.value, Priority.CRITICAL.value, Priority.USER_INITIATED.value
         ] or feedback.get("routing_destination") != AgentType.SCRUM_MASTER.value
     
+    def _should_keep_feedback(self, state: ScrumMasterGraphState) -> bool:
+        """Determine if feedback should be handled by the Scrum Master itself."""
+        return not self._should_forward_feedback(state)
+    
     # State handler methods
     
     @monitor_operation(operation_type="receive_input", 
@@ -2087,25 +2093,56 @@ class ScrumMasterAgent(BaseAgent):
                 
             self.logger.info(f"Found {len(messages)} messages to process")
             
-            # Process each message
-            processed_results = []
-            
-            for message in messages:
-                # Acknowledge message
-                self.agent_communicator.acknowledge_message(self.agent_id, message["id"])
-                
-                # Process message
-                result = await self.handle_incoming_message(message)
-                
-                if result:
-                    processed_results.append(result)
-                    
-            return processed_results
+            return await self._process_agent_messages(messages)
             
         except Exception as e:
             self.logger.error(f"Error checking for agent messages: {str(e)}", exc_info=True)
             return []
     
+    @trace_method
+    async def wait_for_agent_messages(self, timeout: Optional[float] = None) -> List[Dict[str, Any]]:
+        """
+        Wait for incoming messages from other agents and process them on arrival.
+        
+        Args:
+            timeout: Optional maximum number of seconds to wait; 0 only
+                processes messages that have already arrived
+            
+        Returns:
+            List[Dict[str, Any]]: List of processed messages, empty on timeout
+        """
+        self.logger.debug("Waiting for agent messages")
+        
+        try:
+            messages = await self.agent_communicator.wait_for_messages(self.agent_id, timeout=timeout)
+            
+            if not messages:
+                return []
+            
+            self.logger.info(f"Received {len(messages)} messages to process")
+            
+            return await self._process_agent_messages(messages)
+            
+        except Exception as e:
+            self.logger.error(f"Error waiting for agent messages: {str(e)}", exc_info=True)
+            return []
+    
+    async def _process_agent_messages(self, messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Acknowledge and handle a batch of agent messages."""
+        processed_results = []
+        
+        for message in messages:
+            # Process message
+            result = await self.handle_incoming_message(message)
+            
+            # Acknowledge only once processed, so a failure leaves it to be redelivered
+            self.agent_communicator.acknowledge_message(self.agent_id, message["id"])
+            
+            if result:
+                processed_results.append(result)
+                
+        return processed_results
+    
     @monitor_operation(operation_type="run",
                       metadata={"phase": "execution"})
     async def run(self, input_data: Union[str, Dict[str, Any]]) -> Dict[str, Any]:
@@ -2121,8 +2158,8 @@ class ScrumMasterAgent(BaseAgent):
         self.logger.info("Starting ScrumMaster workflow execution")
         
         try:
-            # Check for messages from other agents first
-            agent_messages = await self.check_for_agent_messages()
+            # Collect messages other agents have pushed to this agent's inbox first
+            agent_messages = await self.wait_for_agent_messages(timeout=0)
             
             # Handle string input - create initial state
             if isinstance(input_data, str):
@@ -2158,7 +2195,12 @@ class ScrumMasterAgent(BaseAgent):
             
             # Execute graph
             self.logger.debug("Starting graph execution")
-            result = await self.graph.ainvoke(initial_state)
+            run_options = input_data if isinstance(input_data, dict) else {}
+            result = await self.invoke_graph(
+                initial_state,
+                thread_id=run_options.get("thread_id"),
+                resume=run_options.get("resume", False)
+            )
             
             # If we processed any agent messages, include in response
             if agent_messages:
@@ -5,6 +5,7 @@ from langgraph.graph import StateGraph
 from core.logging.logger import setup_logger
 from agents.core.monitoring.decorators import monitor_operation, monitor_llm
 from agents.core.base_agent import BaseAgent
+from agents.core.graph.checkpointing import get_checkpointer
 from agents.solution_architect.llm.sa_service import LLMService
 from agents.core.graph.graph_builder import WorkflowGraphBuilder  
 from memory.memory_manager import MemoryManager
@@ -35,8 +36,8 @@ class SolutionArchitectAgent(BaseAgent):
             self.agent_communicator = AgentCommunicator()
             self.agent_communicator.register_agent(agent_id)
             
-            # Build the processing graph
-            self.graph = self._build_graph()
+            # Get the shared compiled processing graph
+            self.graph = self._get_compiled_graph()
             self.logger.info("SolutionArchitectAgent initialization completed")
             
         except Exception as e:
@@ -96,7 +97,7 @@ class SolutionArchitectAgent(BaseAgent):
             builder.set_entry_point("start")
             
             # Compile graph
-            compiled_graph = builder.compile()
+            compiled_graph = builder.compile(checkpointer=get_checkpointer())
             self.logger.info("Successfully built and compiled graph with Team Lead coordination")
             
             return compiled_graph
@@ -201,7 +202,11 @@ class SolutionArchitectAgent(BaseAgent):
             
             # Execute graph
             self.logger.debug("Starting graph execution")
-            result = await self.graph.ainvoke(initial_state)
+            result = await self.invoke_graph(
+                initial_state,
+                thread_id=input_data.get("thread_id"),
+                resume=input_data.get("resume", False)
+            )
             
             self.logger.info("Workflow completed successfully")
             
@@ -6,13 +6,16 @@ import os
 from core.logging.logger import setup_logger
 from core.tracing.service import trace_method, trace_class
 from agents.core.base_agent import BaseAgent
+from agents.core.graph.checkpointing import get_checkpointer
 from agents.team_lead.llm.tl_service import TeamLeadLLMService
 from agents.team_lead.tl_state_graph import TeamLeadGraphState, validate_state, get_next_stage
-from tools.team_lead.task_cordinator import coordinate_project_execution
+from tools.team_lead.task_cordinator import (
+    coordinate_project_execution, DependencyIndex, ExecutionDAG
+)
 from tools.team_lead.progress_tracker import (
     update_task_status, calculate_project_progress, identify_bottlenecks,
     analyze_timeline_adherence, detect_at_risk_tasks, generate_progress_report,
-    handle_task_completion_events, manage_checkpoints
+    handle_task_completion_events, manage_checkpoints, ProgressEngine
 )
 from tools.team_lead.agent_communicator import (
     AgentCommunicator, MessageType, MessagePriority, DeliverableType
@@ -20,6 +23,7 @@ from tools.team_lead.agent_communicator import (
 from tools.team_lead.result_compiler import (
     ResultCompiler, ProjectType, ComponentType
 )
+from core.utils.output_writer import session_output_dir
 from memory.memory_manager import MemoryManager
 from memory.base import MemoryType
 from agents.core.monitoring.decorators import monitor_operation
@@ -53,6 +57,9 @@ class TeamLeadAgent(BaseAgent):
         project_name (str): Name of the current project
         has_code_assembler (bool): Whether the Code Assembler Agent is available
         code_assembler_agent (Optional[CodeAssemblerAgent]): Code Assembler Agent instance
+        dependency_index (DependencyIndex): Task dependency index reused across re-plans
+        execution_dag (ExecutionDAG): Execution DAG with incrementally maintained schedule metrics
+        progress_engine (Optional[ProgressEngine]): Incremental progress aggregates for monitoring
     """
     
     def __init__(self, agent_id: str, name: str, memory_manager: MemoryManager):
@@ -82,6 +89,15 @@ class TeamLeadAgent(BaseAgent):
             self.registered_agents = {}
             self.active_tasks = {}
             self.project_name = f"project_{agent_id}"
+            self.session_id = None
+            
+            # Long-lived planning structures, updated incrementally on re-planning
+            self.dependency_index = DependencyIndex()
+            self.execution_dag = ExecutionDAG()
+            
+            # Event-driven progress aggregates, created when monitoring starts
+            self.progress_engine = None
+            self._stored_progress_version = None
             
             # Check Code Assembler availability
             self.has_code_assembler = HAS_CODE_ASSEMBLER
@@ -95,8 +111,8 @@ class TeamLeadAgent(BaseAgent):
             else:
                 self.logger.info("Code Assembler Agent not available, will use basic compilation")
             
-            # Build the processing graph
-            self.graph = self._build_graph()
+            # Get the shared compiled processing graph
+            self.graph = self._get_compiled_graph()
             self.logger.info("TeamLeadAgent initialization completed")
             
             # Initialize specialized agents (async initialization handled in run method)
@@ -147,8 +163,15 @@ class TeamLeadAgent(BaseAgent):
         self.logger.info("Building TeamLead processing graph")
         try:
             # Initialize graph builder
-            from agents.core.graph.graph_builder import WorkflowGraphBuilder
-            builder = WorkflowGraphBuilder(TeamLeadGraphState)
+            from agents.core.graph.graph_builder import WorkflowGraphBuilder, take_last, merge_dicts
+            
+            # Scrum Master interaction branches can run alongside monitoring,
+            # so keys they share need reducers for concurrent updates
+            builder = WorkflowGraphBuilder(
+                TeamLeadGraphState,
+                reducers={"status": take_last, "progress": merge_dicts},
+                max_concurrency=4
+            )
             
             # Store builder for visualization
             self._graph_builder = builder
@@ -196,6 +219,7 @@ class TeamLeadAgent(BaseAgent):
             builder.add_edge("respond_to_user_query", "monitor_progress")
             
             # Add edges from monitoring to Scrum Master interaction states
+            # (every matching branch runs in parallel)
             builder.add_edge("monitor_progress", "receive_user_feedback",
                           condition=self._has_user_feedback)
             builder.add_edge("monitor_progress", "prepare_milestone_delivery",
@@ -210,7 +234,7 @@ class TeamLeadAgent(BaseAgent):
             # (For simplicity, not fully implemented in this version)
             
             # Compile graph
-            compiled_graph = builder.compile()
+            compiled_graph = builder.compile(checkpointer=get_checkpointer())
             self.logger.info("Successfully built and compiled graph")
             
             return compiled_graph
@@ -428,7 +452,8 @@ class TeamLeadAgent(BaseAgent):
             self.project_name = f"project_{self.agent_id}"
             self.result_compiler.create_project(
                 project_name=self.project_name,
-                project_type=ProjectType.GENERIC
+                project_type=ProjectType.GENERIC,
+                output_base_dir=session_output_dir(self.session_id)
             )
             
             # Record the status transition
@@ -462,7 +487,9 @@ class TeamLeadAgent(BaseAgent):
             # Use task coordinator to break down the project
             execution_result = await coordinate_project_execution(
                 project_plan=project_plan,
-                llm_service=self.llm_service
+                llm_service=self.llm_service,
+                dependency_index=self.dependency_index,
+                execution_dag=self.execution_dag
             )
             
             # Store tasks and execution plan
@@ -700,42 +727,55 @@ class TeamLeadAgent(BaseAgent):
                 else:
                     task_statuses[task_id] = "pending"
             
-            # Analyze current progress
-            project_progress = calculate_project_progress(tasks, execution_plan)
+            # Read current progress from the event-driven aggregates
+            if self.progress_engine is None or not self.progress_engine.matches_plan(execution_plan):
+                self.progress_engine = ProgressEngine(tasks, execution_plan)
+            else:
+                self.progress_engine.sync_tasks(tasks)
+            project_progress = self.progress_engine.get_project_progress()
             state["progress"] = project_progress
             
-            # Check for bottlenecks
-            bottlenecks = identify_bottlenecks(tasks, execution_plan)
-            
-            # Analyze timeline adherence
-            timeline_analysis = analyze_timeline_adherence(tasks, execution_plan)
-            
-            # Detect at-risk tasks
-            at_risk_tasks = detect_at_risk_tasks(tasks, execution_plan, timeline_analysis)
-            
-            # Generate progress report
-            progress_report = generate_progress_report(
-                tasks=tasks,
-                execution_plan=execution_plan,
-                project_progress=project_progress,
-                bottlenecks=bottlenecks,
-                timeline_analysis=timeline_analysis,
-                at_risk_tasks=at_risk_tasks
-            )
-            
-            # Store progress report in memory
-            await self.memory_manager.store(
-                agent_id=self.agent_id,
-                memory_type=MemoryType.WORKING,
-                content={"progress_report": progress_report}
-            )
-            
-            # Analyze if any task needs attention
-            progress_analysis = await self.llm_service.analyze_progress(
-                execution_plan=execution_plan,
-                current_progress=project_progress,
-                task_statuses=task_statuses
-            )
+            # Only run the full analysis when a significant change occurred
+            progress_analysis = {}
+            if self.progress_engine.should_analyze():
+                self.logger.info(f"Analyzing progress due to: {', '.join(self.progress_engine.pending_reasons())}")
+                
+                # Check for bottlenecks
+                bottlenecks = identify_bottlenecks(tasks, execution_plan, self.progress_engine.task_index)
+                
+                # Analyze timeline adherence
+                timeline_analysis = analyze_timeline_adherence(tasks, execution_plan)
+                
+                # Detect at-risk tasks
+                at_risk_tasks = detect_at_risk_tasks(tasks, execution_plan, timeline_analysis)
+                
+                # Generate progress report
+                progress_report = generate_progress_report(
+                    tasks=tasks,
+                    execution_plan=execution_plan,
+                    project_progress=project_progress,
+                    bottlenecks=bottlenecks,
+                    timeline_analysis=timeline_analysis,
+                    at_risk_tasks=at_risk_tasks
+                )
+                
+                # Store progress report in memory
+                await self.memory_manager.store(
+                    agent_id=self.agent_id,
+                    memory_type=MemoryType.WORKING,
+                    content={"progress_report": progress_report}
+                )
+                
+                # Analyze if any task needs attention
+                progress_analysis = await self.llm_service.analyze_progress(
+                    execution_plan=execution_plan,
+                    current_progress=project_progress,
+                    task_statuses=task_statuses
+                )
+                
+                self.progress_engine.mark_analyzed()
+            else:
+                self.logger.debug("No significant progress change, skipping analysis")
             
             # Handle critical issues
             critical_issues = progress_analysis.get("critical_issues", [])
@@ -818,8 +858,10 @@ class TeamLeadAgent(BaseAgent):
                     # Update tasks with new list
                     state["tasks"] = updated_tasks
                     
-                    # Update progress based on new task status
-                    project_progress = calculate_project_progress(updated_tasks, execution_plan)
+                    # Record the status change and read the updated aggregates
+                    completed_entry = next((t for t in updated_tasks if t["id"] == completed_task_id), updated_task)
+                    self.progress_engine.record_task_update(completed_entry)
+                    project_progress = self.progress_engine.get_project_progress()
                     state["progress"] = project_progress
                     
                     # Handle checkpoint if triggered
@@ -833,16 +875,18 @@ class TeamLeadAgent(BaseAgent):
                         )
                         self.logger.info(f"Checkpoint {checkpoint_id} status: {checkpoint_status.get('status')}")
             
-            # Update memory with latest task status
-            await self.memory_manager.store(
-                agent_id=self.agent_id,
-                memory_type=MemoryType.WORKING,
-                content={
-                    "tasks": tasks,
-                    "active_tasks": self.active_tasks,
-                    "progress": project_progress
-                }
-            )
+            # Update memory with latest task status when it changed
+            if self._stored_progress_version != self.progress_engine.version:
+                await self.memory_manager.store(
+                    agent_id=self.agent_id,
+                    memory_type=MemoryType.WORKING,
+                    content={
+                        "tasks": tasks,
+                        "active_tasks": self.active_tasks,
+                        "progress": project_progress
+                    }
+                )
+                self._stored_progress_version = self.progress_engine.version
             
             # Update status
             state["tasks"] = tasks
@@ -953,6 +997,16 @@ class TeamLeadAgent(BaseAgent):
                     "timestamp": datetime.utcnow().isoformat()
                 }
                 
+                # Keep the deliverable in long-term memory; content above ARTIFACT_MIN_SIZE goes to the artifact store
+                await self.memory_manager.store_deliverable(
+                    agent_id=self.agent_id,
+                    deliverable_type=deliverable_type,
+                    content={"content": content, "source_agent_id": agent_id},
+                    project_id=self.project_name,
+                    task_id=task_id,
+                    metadata=deliverables[task_id]["metadata"]
+                )
+                
                 # Add component to result compiler
                 try:
                     self.result_compiler.add_component(
@@ -1680,6 +1734,7 @@ class TeamLeadAgent(BaseAgent):
             await self.initialize_agents()
             
             # Extract input data
+            self.session_id = input_data.get("session_id") or (input_data.get("context") or {}).get("session_id")
             project_description = input_data.get("project_description", "")
             project_plan = input_data.get("project_plan", {})
             
@@ -1718,7 +1773,11 @@ class TeamLeadAgent(BaseAgent):
             }
             
             # Run the workflow
-            final_state = await self.graph.start(state)
+            final_state = await self.invoke_graph(
+                state,
+                thread_id=input_data.get("thread_id"),
+                resume=input_data.get("resume", False)
+            )
             
             # Extract result data
             result = {
@@ -1783,11 +1842,18 @@ class TeamLeadAgent(BaseAgent):
                 tasks = params.get("tasks", self.state.get("tasks", []))
                 execution_plan = params.get("execution_plan", self.state.get("execution_plan", {}))
                 
+                # Reuse the progress engine's task index when reporting on the tracked tasks
+                task_index = None
+                if self.progress_engine is not None and "tasks" not in params:
+                    self.progress_engine.sync_tasks(tasks)
+                    task_index = self.progress_engine.task_index
+                
                 # Use progress tracker to generate report
                 progress_report = generate_progress_report(
                     tasks=tasks,
                     execution_plan=execution_plan,
-                    project_progress=progress
+                    project_progress=progress,
+                    task_index=task_index
                 )
                 
                 return {
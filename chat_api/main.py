@@ -3,10 +3,11 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
 
-from chat_api.routes import session_routes, message_routes, file_routes, agent_routes, auth_routes
+from chat_api.routes import session_routes, message_routes, file_routes, agent_routes, auth_routes, export_routes
 from chat_api.config import settings
 from chat_api.database import Base, engine, memory_manager, get_memory_manager
 from core.logging.logger import setup_logger
+from agents.core.graph.checkpointing import close_checkpointer
 
 # Initialize logger
 logger = setup_logger(__name__)
@@ -45,8 +46,14 @@ app.include_router(session_routes.router, prefix=settings.API_PREFIX)
 app.include_router(message_routes.router, prefix=settings.API_PREFIX)
 app.include_router(file_routes.router, prefix=settings.API_PREFIX)
 app.include_router(agent_routes.router, prefix=settings.API_PREFIX)
+app.include_router(export_routes.router, prefix=settings.API_PREFIX)
 logger.info("API routes registered")
 
+@app.on_event("shutdown")
+async def shutdown_checkpointer():
+    """Close agent workflow checkpoint connections on shutdown."""
+    await close_checkpointer()
+
 # Exception handlers
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
@@ -0,0 +1,159 @@
+import os
+from uuid import UUID
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from chat_api.adapters.memory_adapter import MemoryAdapter
+from chat_api.auth.dependencies import get_current_user_id
+from chat_api.database import get_db
+from chat_api.services.session_service import SessionService
+from chat_api.utils.response_formatter import format_success_response, raise_http_exception
+from core.logging.logger import setup_logger
+from core.utils.output_writer import BUNDLE_FORMATS, session_output_dir
+from core.utils.project_export import MEDIA_TYPES, build_manifest, bundle_filename, stream_bundle
+
+# Initialize logger
+logger = setup_logger("chat_api.routes.export_routes")
+
+# Create router
+router = APIRouter(prefix="/exports", tags=["exports"])
+
+# Dependency for SessionService
+def get_session_service(db: Session = Depends(get_db)) -> SessionService:
+    """FastAPI dependency for the session service."""
+    memory_adapter = MemoryAdapter()
+    return SessionService(db_session=db, memory_adapter=memory_adapter)
+
+def check_session_access(session_service: SessionService, session_id: UUID, user_id: UUID) -> None:
+    """
+    Ensure a session exists and belongs to the current user.
+
+    Args:
+        session_service: Session service
+        session_id: ID of the session
+        user_id: ID of the current user
+    """
+    session = session_service.get_session(session_id=session_id)
+    if not session:
+        raise_http_exception(
+            error_code="session_not_found",
+            message=f"Session {session_id} not found",
+            status_code=status.HTTP_404_NOT_FOUND
+        )
+
+    if session.user_id != user_id:
+        raise_http_exception(
+            error_code="permission_denied",
+            message="Not authorized to access this session",
+            status_code=status.HTTP_403_FORBIDDEN
+        )
+
+def resolve_export_dir(session_id: UUID, path: str) -> str:
+    """
+    Resolve a project directory below a session's generated output root.
+
+    Each session's output lives in the directory its agents and run
+    scripts write to (see session_output_dir), for example code/ for the
+    Full Stack Developer's components or the Code Assembler's project
+    directory. The session root itself cannot be exported, only
+    directories below it.
+
+    Args:
+        session_id: ID of the session owning the output
+        path: Directory relative to the session's output root
+
+    Returns:
+        str: Absolute path of the directory
+    """
+    root = os.path.realpath(session_output_dir(str(session_id)))
+    target = os.path.realpath(os.path.join(root, path.strip("/")))
+    if not target.startswith(root + os.sep):
+        raise_http_exception(
+            error_code="invalid_path",
+            message="Export path must name a directory inside the session's generated output",
+            status_code=status.HTTP_400_BAD_REQUEST
+        )
+    if not os.path.isdir(target):
+        raise_http_exception(
+            error_code="export_not_found",
+            message=f"No generated output found at '{path}'",
+            status_code=status.HTTP_404_NOT_FOUND
+        )
+    return target
+
+@router.get("/sessions/{session_id}/bundle")
+async def download_bundle(
+    session_id: UUID,
+    path: str = Query(..., description="Directory relative to the session's generated output root"),
+    format: str = Query("zip", description="Bundle format: zip, tar or tar.gz"),
+    manifest: bool = Query(True, description="Append MANIFEST.json with per-file hashes"),
+    session_service: SessionService = Depends(get_session_service),
+    user_id: UUID = Depends(get_current_user_id)
+):
+    """
+    Stream generated output as a zip or tar archive.
+
+    The archive is produced while it is sent, so the response starts
+    immediately and memory use does not depend on project size.
+
+    Args:
+        session_id: ID of the session owning the output
+        path: Directory relative to the session's generated output root
+        format: Bundle format
+        manifest: Whether to include the hash manifest
+
+    Returns:
+        Streaming archive download
+    """
+    if format not in BUNDLE_FORMATS:
+        raise_http_exception(
+            error_code="invalid_format",
+            message=f"Unsupported bundle format '{format}'. Use one of {sorted(BUNDLE_FORMATS)}",
+            status_code=status.HTTP_400_BAD_REQUEST
+        )
+
+    check_session_access(session_service, session_id, user_id)
+    export_dir = resolve_export_dir(session_id, path)
+    name = os.path.basename(export_dir)
+    filename = bundle_filename(name, format)
+    logger.info(f"Streaming {format} export of {export_dir} for user {user_id}")
+
+    return StreamingResponse(
+        stream_bundle(export_dir, bundle_format=format, root_name=name, include_manifest=manifest),
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
+@router.get("/sessions/{session_id}/manifest")
+async def get_manifest(
+    session_id: UUID,
+    path: str = Query(..., description="Directory relative to the session's generated output root"),
+    session_service: SessionService = Depends(get_session_service),
+    user_id: UUID = Depends(get_current_user_id)
+):
+    """
+    Get the per-file SHA-256 manifest of generated output.
+
+    Args:
+        session_id: ID of the session owning the output
+        path: Directory relative to the session's generated output root
+
+    Returns:
+        Manifest with the hash and size of each file
+    """
+    check_session_access(session_service, session_id, user_id)
+    export_dir = resolve_export_dir(session_id, path)
+    try:
+        manifest = await run_in_threadpool(build_manifest, export_dir)
+        return format_success_response(data=manifest)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error building manifest for {export_dir}: {str(e)}")
+        raise_http_exception(
+            error_code="manifest_failed",
+            message=f"Failed to build manifest: {str(e)}",
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
@@ -4,8 +4,8 @@ import re
 import uuid
 from pydantic import ValidationError
 from core.logging.logger import setup_logger
-from chat_api.models.session import SessionStatus, SessionType, AgentType
-from chat_api.models.message import MessageRole, MessageType
+from chat_api.schemas.session_schemas import SessionStatus, SessionType, AgentType
+from chat_api.schemas.message_schemas import MessageRole, MessageType
 from chat_api.config import settings
 
 # Initialize logger
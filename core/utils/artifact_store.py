@@ -0,0 +1,296 @@
+import hashlib
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Any, Iterable, List, Optional, Union
+from core.logging.logger import setup_logger
+from core.utils.output_writer import write_atomic
+
+# Initialize logger
+logger = setup_logger("core.utils.artifact_store")
+
+# Repository root, used to anchor relative store paths
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+# Directory holding stored artifacts; relative paths are taken from the repository root
+ARTIFACT_STORE_DIR = str(PROJECT_ROOT / os.getenv("VITA_ARTIFACT_STORE_DIR", "data/artifact_store"))
+
+# Byte budget of the in-memory cache in front of the disk store
+ARTIFACT_CACHE_BYTES = int(os.getenv("VITA_ARTIFACT_CACHE_BYTES", str(64 * 1024 * 1024)))
+
+# Strings at least this long are replaced by references when externalizing
+ARTIFACT_MIN_SIZE = 1024
+
+# Unreferenced artifacts neither stored nor read for this long are removed by garbage collection
+ARTIFACT_RETENTION_SECONDS = int(os.getenv("VITA_ARTIFACT_RETENTION_DAYS", "30")) * 24 * 3600
+
+# Key marking a dict as an artifact reference
+REF_KEY = "$artifact"
+
+_REF_RE = re.compile(r"^sha256:([0-9a-f]{64})$")
+
+def is_artifact_ref(value: Any) -> bool:
+    """Check whether a value is an artifact reference."""
+    return isinstance(value, dict) and isinstance(value.get(REF_KEY), str) and bool(_REF_RE.match(value[REF_KEY]))
+
+def find_refs(value: Any) -> List[str]:
+    """Keys of all artifact references in a nested structure, in order of appearance."""
+    if is_artifact_ref(value):
+        return [value[REF_KEY]]
+    if isinstance(value, dict):
+        return [key for item in value.values() for key in find_refs(item)]
+    if isinstance(value, list):
+        return [key for item in value for key in find_refs(item)]
+    return []
+
+class ArtifactStore:
+    """
+    Content-addressed blob store for generated deliverables.
+
+    Content is stored once on disk under its SHA-256 digest and is identified
+    by a "sha256:<hex>" key, so the same file produced or passed on by several
+    agents takes up space only once. Reads go through an LRU cache bounded by
+    a byte budget. Blobs are immutable; writes are atomic and idempotent.
+
+    collect_garbage is a mark-and-sweep: the caller passes the keys still
+    referenced (marked) and only the other blobs are swept. Storing or
+    reading a blob refreshes its modification time, and unreferenced blobs
+    are kept for the retention period so content stored just before the
+    entry referencing it is written is not lost.
+    """
+
+    def __init__(self, root_dir: str = ARTIFACT_STORE_DIR, cache_bytes: int = ARTIFACT_CACHE_BYTES):
+        self.root_dir = root_dir
+        self.cache_bytes = cache_bytes
+        self._cache: "OrderedDict[str, bytes]" = OrderedDict()
+        self._cached_bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, key: str) -> str:
+        match = _REF_RE.match(key)
+        if not match:
+            raise ValueError(f"Invalid artifact key: {key}")
+        digest = match.group(1)
+        return os.path.join(self.root_dir, "sha256", digest[:2], digest)
+
+    def _touch(self, path: str) -> bool:
+        """Mark a blob as used for garbage collection; False if it does not exist."""
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            return False
+        except OSError as e:
+            logger.debug(f"Could not refresh artifact timestamp of {path}: {str(e)}")
+        return True
+
+    def _remember(self, key: str, data: bytes) -> None:
+        if len(data) > self.cache_bytes:
+            return
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return
+            self._cache[key] = data
+            self._cached_bytes += len(data)
+            while self._cached_bytes > self.cache_bytes:
+                _, evicted = self._cache.popitem(last=False)
+                self._cached_bytes -= len(evicted)
+
+    def put(self, content: Union[str, bytes]) -> str:
+        """
+        Store content, writing it to disk only if it is not stored yet.
+
+        Args:
+            content: Text (stored as UTF-8) or bytes
+
+        Returns:
+            str: Key of the stored content
+        """
+        data = content.encode("utf-8") if isinstance(content, str) else bytes(content)
+        key = f"sha256:{hashlib.sha256(data).hexdigest()}"
+        path = self._path(key)
+        if not self._touch(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            write_atomic(path, data)
+            logger.debug(f"Stored artifact {key} ({len(data)} bytes)")
+        self._remember(key, data)
+        return key
+
+    def get(self, key: str) -> bytes:
+        """
+        Load stored content.
+
+        Args:
+            key: Key returned by put
+
+        Returns:
+            bytes: Stored content
+
+        Raises:
+            KeyError: If no artifact is stored under the key
+        """
+        with self._lock:
+            data = self._cache.get(key)
+            if data is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return data
+            self.misses += 1
+
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            raise KeyError(f"Artifact not found: {key}")
+        self._touch(path)
+        self._remember(key, data)
+        return data
+
+    def get_text(self, key: str) -> str:
+        """Load stored content as UTF-8 text."""
+        return self.get(key).decode("utf-8")
+
+    def exists(self, key: str) -> bool:
+        """Check whether content is stored under a key."""
+        with self._lock:
+            if key in self._cache:
+                return True
+        return os.path.exists(self._path(key))
+
+    def ref(self, content: Union[str, bytes]) -> Dict[str, Any]:
+        """
+        Store content and return a reference to embed in state or memory.
+
+        Args:
+            content: Text or bytes
+
+        Returns:
+            Dict[str, Any]: Reference holding the key, size and kind of content
+        """
+        key = self.put(content)
+        return {
+            REF_KEY: key,
+            "size": len(content.encode("utf-8")) if isinstance(content, str) else len(content),
+            "kind": "text" if isinstance(content, str) else "bytes",
+        }
+
+    def load(self, ref: Dict[str, Any]) -> Union[str, bytes]:
+        """Load the content a reference points to, as text or bytes like it was stored."""
+        data = self.get(ref[REF_KEY])
+        return data.decode("utf-8") if ref.get("kind", "text") == "text" else data
+
+    def externalize(self, value: Any, min_size: int = ARTIFACT_MIN_SIZE) -> Any:
+        """
+        Replace large strings and bytes in a nested structure by references.
+
+        Dicts and lists are copied; everything else is shared with the input.
+
+        Args:
+            value: Value to externalize
+            min_size: Minimum length of strings and bytes moved to the store
+
+        Returns:
+            Any: Equivalent structure holding references instead of large content
+        """
+        if isinstance(value, (str, bytes)):
+            return self.ref(value) if len(value) >= min_size else value
+        if isinstance(value, dict):
+            if is_artifact_ref(value):
+                return value
+            return {k: self.externalize(v, min_size) for k, v in value.items()}
+        if isinstance(value, list):
+            return [self.externalize(v, min_size) for v in value]
+        return value
+
+    def resolve(self, value: Any, keep_missing: bool = False) -> Any:
+        """
+        Replace references in a nested structure by their content.
+
+        Args:
+            value: Value that may contain references
+            keep_missing: Leave references to missing artifacts in place
+                instead of raising KeyError
+
+        Returns:
+            Any: Equivalent structure with content loaded from the store
+
+        Raises:
+            KeyError: If a referenced artifact is missing and keep_missing is False
+        """
+        if isinstance(value, dict):
+            if is_artifact_ref(value):
+                try:
+                    return self.load(value)
+                except KeyError:
+                    if keep_missing:
+                        return value
+                    raise
+            return {k: self.resolve(v, keep_missing) for k, v in value.items()}
+        if isinstance(value, list):
+            return [self.resolve(v, keep_missing) for v in value]
+        return value
+
+    def collect_garbage(
+        self,
+        live: Iterable[str],
+        max_age_seconds: int = ARTIFACT_RETENTION_SECONDS
+    ) -> Dict[str, int]:
+        """
+        Remove artifacts nothing references any more.
+
+        live must hold every key still referenced, e.g. find_refs over all
+        stored memory entries; an incomplete set loses the content of the
+        references it misses. Artifacts held in the cache count as recently
+        used and are kept.
+
+        Args:
+            live: Keys of all referenced artifacts, kept regardless of age
+            max_age_seconds: Retention period of unreferenced artifacts
+
+        Returns:
+            Dict[str, int]: Number of removed artifacts and bytes freed
+        """
+        blob_dir = os.path.join(self.root_dir, "sha256")
+        cutoff = time.time() - max_age_seconds
+        with self._lock:
+            keep = set(live) | set(self._cache)
+        removed = freed = 0
+
+        for dirpath, _, filenames in os.walk(blob_dir):
+            for filename in filenames:
+                key = f"sha256:{filename}"
+                if not _REF_RE.match(key) or key in keep:
+                    continue
+                path = os.path.join(dirpath, filename)
+                try:
+                    stat = os.stat(path)
+                    if stat.st_mtime >= cutoff:
+                        continue
+                    os.remove(path)
+                except FileNotFoundError:
+                    continue
+                removed += 1
+                freed += stat.st_size
+
+        if removed:
+            logger.info(f"Collected {removed} unused artifacts ({freed} bytes)")
+        return {"removed": removed, "freed_bytes": freed}
+
+    def stats(self) -> Dict[str, Any]:
+        """Cache statistics."""
+        with self._lock:
+            return {
+                "cached_artifacts": len(self._cache),
+                "cached_bytes": self._cached_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+# Create singleton instance
+artifact_store = ArtifactStore()
@@ -0,0 +1,541 @@
+import ast
+import hashlib
+import os
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, List, Any, Optional, Tuple
+from urllib.parse import urlparse
+from core.logging.logger import setup_logger
+
+# Initialize logger
+logger = setup_logger("core.utils.code_analysis")
+
+# Maximum number of symbol tables kept in the analysis cache
+SYMBOL_TABLE_CACHE_SIZE = 512
+
+HTTP_METHODS = ("get", "post", "put", "delete", "patch")
+
+LANGUAGE_BY_EXTENSION = {
+    ".py": "python",
+    ".js": "javascript",
+    ".jsx": "javascript",
+    ".mjs": "javascript",
+    ".cjs": "javascript",
+    ".ts": "typescript",
+    ".tsx": "typescript",
+    ".java": "java",
+    ".sql": "sql",
+}
+
+# Source-level patterns, used for languages without a dedicated parser and
+# for constructs that are plain text in any language (SQL DDL, Spring mappings)
+_EXPRESS_ROUTE_RE = re.compile(r"\.(get|post|put|delete|patch)\(['\"]([^'\"]+)['\"]", re.IGNORECASE)
+_FLASK_ROUTE_RE = re.compile(r"@app\.route\(['\"]([^'\"]+)['\"]", re.IGNORECASE)
+_SPRING_ROUTE_RE = re.compile(r"@(Get|Post|Put|Delete|Patch)Mapping\(['\"]([^'\"]*)['\"]", re.IGNORECASE)
+_FETCH_RE = re.compile(r"fetch\(['\"]([^'\"]+)['\"]")
+_AXIOS_RE = re.compile(r"axios\.(get|post|put|delete|patch)\(['\"]([^'\"]+)['\"]")
+_URL_PROPERTY_RE = re.compile(r"(url|URL|endpoint|api)\s*:\s*['\"]([^'\"]+)['\"]")
+_MONGOOSE_MODEL_RE = re.compile(r"mongoose\.model\(['\"]([^'\"]+)['\"]")
+_SEQUELIZE_MODEL_RE = re.compile(r"sequelize\.define\(['\"]([^'\"]+)['\"]")
+_SQL_TABLE_RE = re.compile(r"CREATE\s+TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?[`\"]?(\w+)[`\"]?", re.IGNORECASE)
+_MODEL_IMPORT_RE = re.compile(r"(?:require|import)\s*\(?['\"].*models?\/([^'\"\/]+)['\"]")
+_MODEL_TYPE_RE = re.compile(r"(Model|Entity|Table|Document)\s*[:{<]\s*['\"]?([a-zA-Z0-9_]+)['\"]?")
+_MODEL_VARIABLE_RE = re.compile(r"(?:const|let|var)\s+([A-Z][a-zA-Z0-9_]*(?:Model|Entity|Schema))\s*=")
+_CLASS_RE = re.compile(r"class\s+(\w+)")
+_PY_METHOD_RE = re.compile(r"(async\s+)?def\s+(\w+)\s*\(self(?:,\s*([^)]*))?\)")
+_PY_CLASS_RE = re.compile(r"^\s*class\s+(\w+)\s*(?:\(([^)]*)\))?\s*:", re.MULTILINE)
+_PY_IMPORT_RE = re.compile(r"^\s*import\s+([\w.]+(?:\s+as\s+\w+)?(?:\s*,\s*[\w.]+(?:\s+as\s+\w+)?)*)", re.MULTILINE)
+_PY_FROM_IMPORT_RE = re.compile(r"^\s*from\s+([.\w]+)\s+import\s+", re.MULTILINE)
+
+_MODEL_SUFFIX_RE = re.compile(r"(Model|Entity|Schema)$")
+
+# Lightweight JavaScript/TypeScript tokenizer. Regex literals are not
+# recognised; a stray '/' is emitted as punctuation, which is harmless for
+# the declarations and calls extracted here.
+_JS_TOKEN_RE = re.compile(r"""
+    (?P<space>\s+)
+  | (?P<comment>//[^\n]*|/\*.*?(?:\*/|\Z))
+  | (?P<string>'(?:\\.|[^'\\\n])*'|"(?:\\.|[^"\\\n])*")
+  | (?P<template>`(?:\\.|[^`\\])*`)
+  | (?P<name>[A-Za-z_$][\w$]*)
+  | (?P<number>\d[\w.]*)
+  | (?P<punct>=>|\.\.\.|[^\s\w])
+""", re.VERBOSE | re.DOTALL)
+
+# Identifiers followed by "(...) {" that are not function declarations
+_JS_NON_FUNCTION_NAMES = frozenset({
+    "if", "for", "while", "switch", "catch", "with", "return", "function",
+    "typeof", "new", "await", "yield", "do", "else", "try", "super", "import",
+})
+
+_PY_MODEL_BASES = frozenset({"Model", "Base", "DeclarativeBase", "SQLModel", "Document"})
+
+@dataclass
+class SymbolTable:
+    """
+    Structured symbols extracted from one source file.
+
+    Symbol tables are cached by content hash and shared between callers,
+    so they must be treated as read-only.
+    """
+    language: str
+    content_hash: str
+    classes: List[Dict[str, Any]] = field(default_factory=list)
+    functions: List[Dict[str, Any]] = field(default_factory=list)
+    imports: List[str] = field(default_factory=list)
+    routes: List[str] = field(default_factory=list)
+    api_calls: List[str] = field(default_factory=list)
+    models_defined: List[str] = field(default_factory=list)
+    model_refs: List[str] = field(default_factory=list)
+    parsed: bool = True
+
+    def first_class(self) -> Optional[str]:
+        """Name of the first class declared in the file."""
+        return self.classes[0]["name"] if self.classes else None
+
+    def constructor_params(self) -> List[str]:
+        """Parameters of the first constructor (__init__ or constructor) in the file."""
+        for function in self.functions:
+            if function["class_name"] and function["name"] in ("__init__", "constructor"):
+                return function["params"]
+        return []
+
+def detect_language(file_path: str = "", content: str = "") -> str:
+    """
+    Detect a source file's language from its extension, falling back to content.
+
+    Args:
+        file_path: Path of the file
+        content: File content
+
+    Returns:
+        str: Language name, or "unknown"
+    """
+    language = LANGUAGE_BY_EXTENSION.get(os.path.splitext(file_path)[1].lower())
+    if language:
+        return language
+    if re.search(r"^\s*(?:async\s+)?def\s+\w+\s*\(|^\s*from\s+[\w.]+\s+import\s", content, re.MULTILINE):
+        return "python"
+    if re.search(r"\b(?:const|let|function|require\s*\(|export\s+default)\b", content):
+        return "javascript"
+    return "unknown"
+
+def content_hash(content: str) -> str:
+    """Hash file content for cache lookups."""
+    return hashlib.sha1(content.encode("utf-8", "surrogatepass")).hexdigest()
+
+def _api_path(url: str) -> str:
+    """Reduce an absolute URL to its path."""
+    if url.startswith("http"):
+        try:
+            return urlparse(url).path
+        except ValueError:
+            return url
+    return url
+
+def _scan_text(table: SymbolTable, content: str) -> None:
+    """Extract symbols with the source-level patterns."""
+    table.routes.extend(m.group(2) for m in _EXPRESS_ROUTE_RE.finditer(content))
+    table.routes.extend(_FLASK_ROUTE_RE.findall(content))
+    table.routes.extend(m.group(2) or "/" for m in _SPRING_ROUTE_RE.finditer(content))
+
+    table.api_calls.extend(_api_path(url) for url in _FETCH_RE.findall(content))
+    table.api_calls.extend(m.group(2) for m in _AXIOS_RE.finditer(content))
+    table.api_calls.extend(m.group(2) for m in _URL_PROPERTY_RE.finditer(content))
+
+    table.models_defined.extend(_MONGOOSE_MODEL_RE.findall(content))
+    table.models_defined.extend(_SEQUELIZE_MODEL_RE.findall(content))
+
+    table.model_refs.extend(_MODEL_IMPORT_RE.findall(content))
+    table.model_refs.extend(m.group(2) for m in _MODEL_TYPE_RE.finditer(content))
+    table.model_refs.extend(_MODEL_SUFFIX_RE.sub("", name) for name in _MODEL_VARIABLE_RE.findall(content))
+
+    for match in _CLASS_RE.finditer(content):
+        table.classes.append({"name": match.group(1), "bases": []})
+
+def _scan_python_fallback(table: SymbolTable, content: str) -> None:
+    """Extract Python classes, imports and methods with patterns when the source does not parse."""
+    table.classes = [
+        {"name": match.group(1), "bases": [base.strip().split(".")[-1] for base in (match.group(2) or "").split(",") if base.strip()]}
+        for match in _PY_CLASS_RE.finditer(content)
+    ]
+    for match in _PY_IMPORT_RE.finditer(content):
+        table.imports.extend(name.split()[0] for name in match.group(1).split(","))
+    table.imports.extend(_PY_FROM_IMPORT_RE.findall(content))
+
+    class_name = table.first_class()
+    for match in _PY_METHOD_RE.finditer(content):
+        params = [param.strip() for param in (match.group(3) or "").split(",") if param.strip()]
+        table.functions.append({
+            "name": match.group(2),
+            "params": params,
+            "is_async": bool(match.group(1)),
+            "class_name": class_name
+        })
+
+def _format_python_params(args: ast.arguments, is_method: bool) -> List[str]:
+    """Render a Python signature's parameters, without the self/cls receiver."""
+    positional = list(args.posonlyargs) + list(args.args)
+    defaults = [None] * (len(positional) - len(args.defaults)) + list(args.defaults)
+    params = []
+    for index, (arg, default) in enumerate(zip(positional, defaults)):
+        if is_method and index == 0 and arg.arg in ("self", "cls"):
+            continue
+        params.append(_format_python_param(arg, default))
+    if args.vararg:
+        params.append("*" + _format_python_param(args.vararg, None))
+    elif args.kwonlyargs:
+        params.append("*")
+    for arg, default in zip(args.kwonlyargs, args.kw_defaults):
+        params.append(_format_python_param(arg, default))
+    if args.kwarg:
+        params.append("**" + _format_python_param(args.kwarg, None))
+    return params
+
+def _format_python_param(arg: ast.arg, default: Optional[ast.expr]) -> str:
+    text = arg.arg
+    if arg.annotation is not None:
+        text += f": {ast.unparse(arg.annotation)}"
+    if default is not None:
+        text += f" = {ast.unparse(default)}"
+    return text
+
+def _string_arg(call: ast.Call) -> Optional[str]:
+    """First positional argument of a call, if it is a string literal."""
+    if call.args and isinstance(call.args[0], ast.Constant) and isinstance(call.args[0].value, str):
+        return call.args[0].value
+    return None
+
+def _python_route(decorator: ast.expr) -> Optional[str]:
+    """Path of a Flask/FastAPI style route decorator."""
+    if not isinstance(decorator, ast.Call) or not isinstance(decorator.func, ast.Attribute):
+        return None
+    if decorator.func.attr not in ("route",) + HTTP_METHODS:
+        return None
+    return _string_arg(decorator)
+
+def _base_name(base: ast.expr) -> str:
+    if isinstance(base, ast.Attribute):
+        return base.attr
+    if isinstance(base, ast.Name):
+        return base.id
+    return ""
+
+def _analyze_python(table: SymbolTable, tree: ast.Module) -> None:
+    """Extract symbols from a parsed Python module."""
+    def visit(node: ast.AST, class_name: Optional[str]) -> None:
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, ast.ClassDef):
+                bases = [_base_name(base) for base in child.bases]
+                table.classes.append({"name": child.name, "bases": bases})
+                if _PY_MODEL_BASES.intersection(bases):
+                    table.models_defined.append(child.name)
+                visit(child, child.name)
+            elif isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                table.functions.append({
+                    "name": child.name,
+                    "params": _format_python_params(child.args, class_name is not None),
+                    "is_async": isinstance(child, ast.AsyncFunctionDef),
+                    "class_name": class_name
+                })
+                for decorator in child.decorator_list:
+                    route = _python_route(decorator)
+                    if route is not None:
+                        table.routes.append(route)
+                # Nested functions are not part of the file's interface
+            elif isinstance(child, ast.Import):
+                table.imports.extend(alias.name for alias in child.names)
+            elif isinstance(child, ast.ImportFrom):
+                module = "." * child.level + (child.module or "")
+                table.imports.append(module)
+                if "models" in module.split(".") or module.rstrip(".").endswith("model"):
+                    table.model_refs.extend(alias.name for alias in child.names if alias.name != "*")
+            else:
+                visit(child, class_name)
+
+    visit(tree, None)
+
+def tokenize_js(content: str) -> List[Tuple[str, str, int, int]]:
+    """
+    Split JavaScript/TypeScript source into tokens.
+
+    Whitespace and comments are dropped. String tokens carry their unquoted
+    value; template literals are kept separate as they may be interpolated.
+
+    Args:
+        content: Source code
+
+    Returns:
+        List[Tuple[str, str, int, int]]: (kind, value, start, end) per token
+    """
+    tokens = []
+    for match in _JS_TOKEN_RE.finditer(content):
+        kind = match.lastgroup
+        if kind in ("space", "comment"):
+            continue
+        value = match.group()
+        if kind in ("string", "template"):
+            value = value[1:-1]
+        tokens.append((kind, value, match.start(), match.end()))
+    return tokens
+
+def _matching_paren(tokens: List[Tuple[str, str, int, int]], start: int) -> int:
+    """Index of the ')' closing the '(' at start, or -1."""
+    depth = 0
+    for index in range(start, len(tokens)):
+        value = tokens[index][1] if tokens[index][0] == "punct" else None
+        if value == "(":
+            depth += 1
+        elif value == ")":
+            depth -= 1
+            if depth == 0:
+                return index
+    return -1
+
+def _split_js_params(content: str, tokens: List[Tuple[str, str, int, int]], open_index: int, close_index: int) -> List[str]:
+    """Source text of the top-level comma-separated parameters between parens."""
+    params = []
+    depth = 0
+    segment_start = tokens[open_index][3]
+    for kind, value, start, end in tokens[open_index + 1:close_index]:
+        if kind != "punct":
+            continue
+        if value in "([{":
+            depth += 1
+        elif value in ")]}":
+            depth -= 1
+        elif value == "," and depth == 0:
+            params.append(content[segment_start:start].strip())
+            segment_start = end
+    params.append(content[segment_start:tokens[close_index][2]].strip())
+    return [param for param in params if param]
+
+def _analyze_js(table: SymbolTable, content: str) -> None:
+    """Extract symbols from JavaScript/TypeScript tokens."""
+    tokens = tokenize_js(content)
+    count = len(tokens)
+
+    def value_at(index: int) -> Optional[str]:
+        return tokens[index][1] if 0 <= index < count else None
+
+    def kind_at(index: int) -> Optional[str]:
+        return tokens[index][0] if 0 <= index < count else None
+
+    def is_punct(index: int, value: str) -> bool:
+        return kind_at(index) == "punct" and value_at(index) == value
+
+    def string_call_arg(paren_index: int) -> Optional[str]:
+        """String literal passed as the first argument of the call at paren_index."""
+        if is_punct(paren_index, "(") and kind_at(paren_index + 1) == "string":
+            return value_at(paren_index + 1)
+        return None
+
+    depth = 0
+    class_stack: List[Tuple[str, int]] = []
+    pending_class = None
+
+    for index, (kind, value, _, _) in enumerate(tokens):
+        if kind == "punct":
+            if value == "{":
+                depth += 1
+                if pending_class:
+                    class_stack.append((pending_class, depth))
+                    pending_class = None
+            elif value == "}":
+                if class_stack and class_stack[-1][1] == depth:
+                    class_stack.pop()
+                depth -= 1
+            continue
+
+        if kind != "name":
+            continue
+        class_name = class_stack[-1][0] if class_stack and class_stack[-1][1] == depth else None
+
+        # Declarations
+        if value == "class" and kind_at(index + 1) == "name":
+            pending_class = value_at(index + 1)
+            table.classes.append({"name": pending_class, "bases": [value_at(index + 3)] if value_at(index + 2) == "extends" else []})
+            continue
+
+        if value in ("const", "let", "var") and kind_at(index + 1) == "name" and is_punct(index + 2, "="):
+            variable = value_at(index + 1)
+            if variable[:1].isupper() and _MODEL_SUFFIX_RE.search(variable):
+                table.model_refs.append(_MODEL_SUFFIX_RE.sub("", variable))
+
+        if value not in _JS_NON_FUNCTION_NAMES and is_punct(index + 1, "("):
+            close_index = _matching_paren(tokens, index + 1)
+            # name(...) { ... } is a function, class method or object method declaration
+            if close_index != -1 and is_punct(close_index + 1, "{"):
+                is_declaration = (
+                    class_name is not None or
+                    value_at(index - 1) in ("function", "async", "static", "get", "set") or
+                    is_punct(index - 1, "{") or is_punct(index - 1, ",")
+                )
+                if is_declaration:
+                    table.functions.append({
+                        "name": value,
+                        "params": _split_js_params(content, tokens, index + 1, close_index),
+                        "is_async": "async" in (value_at(index - 1), value_at(index - 2)),
+                        "class_name": class_name
+                    })
+
+        if kind_at(index + 1) == "punct" and value_at(index + 1) in ("=", ":"):
+            # name = (...) => / name = async (...) => / name: function (...)
+            start = index + 2
+            is_async = value_at(start) == "async"
+            if is_async:
+                start += 1
+            if value_at(start) == "function":
+                start += 1
+            if is_punct(start, "("):
+                close_index = _matching_paren(tokens, start)
+                if close_index != -1 and (is_punct(close_index + 1, "=>") or value_at(start - 1) == "function"):
+                    table.functions.append({
+                        "name": value,
+                        "params": _split_js_params(content, tokens, start, close_index),
+                        "is_async": is_async,
+                        "class_name": class_name
+                    })
+
+        # Imports
+        if value == "require":
+            module = string_call_arg(index + 1)
+            if module is not None:
+                table.imports.append(module)
+        elif value == "import" and not is_punct(index + 1, "("):
+            cursor = index + 1
+            while cursor < count and kind_at(cursor) != "string" and not is_punct(cursor, ";"):
+                if value_at(cursor) == "import" and kind_at(cursor) == "name":
+                    break
+                cursor += 1
+            if kind_at(cursor) == "string":
+                table.imports.append(value_at(cursor))
+
+        # Calls
+        if value in HTTP_METHODS and is_punct(index - 1, "."):
+            path = string_call_arg(index + 1)
+            if path is not None:
+                if value_at(index - 2) == "axios":
+                    table.api_calls.append(path)
+                else:
+                    table.routes.append(path)
+        elif value == "fetch" and not is_punct(index - 1, "."):
+            url = string_call_arg(index + 1)
+            if url is not None:
+                table.api_calls.append(_api_path(url))
+        elif value in ("url", "URL", "endpoint", "api") and is_punct(index + 1, ":") and kind_at(index + 2) == "string":
+            table.api_calls.append(value_at(index + 2))
+        elif value == "model" and value_at(index - 2) == "mongoose" and is_punct(index - 1, "."):
+            name = string_call_arg(index + 1)
+            if name is not None:
+                table.models_defined.append(name)
+        elif value == "define" and value_at(index - 2) == "sequelize" and is_punct(index - 1, "."):
+            name = string_call_arg(index + 1)
+            if name is not None:
+                table.models_defined.append(name)
+        elif value in ("Model", "Entity", "Table", "Document") and value_at(index + 1) in (":", "{", "<") \
+                and kind_at(index + 2) in ("name", "string"):
+            table.model_refs.append(value_at(index + 2))
+
+    for module in table.imports:
+        match = re.search(r"models?/([^/]+)$", module)
+        if match:
+            table.model_refs.append(os.path.splitext(match.group(1))[0])
+
+def _analyze(content: str, language: str, digest: str) -> SymbolTable:
+    """Build the symbol table for a source file."""
+    table = SymbolTable(language=language, content_hash=digest)
+
+    if language == "python":
+        try:
+            tree = ast.parse(content)
+        except (SyntaxError, ValueError) as e:
+            logger.debug(f"Python source does not parse ({str(e)}), using pattern extraction")
+            table.parsed = False
+            _scan_text(table, content)
+            _scan_python_fallback(table, content)
+        else:
+            _analyze_python(table, tree)
+    elif language in ("javascript", "typescript"):
+        _analyze_js(table, content)
+    else:
+        table.parsed = False
+        _scan_text(table, content)
+
+    # DDL can be embedded in migrations or seed scripts of any language
+    table.models_defined.extend(_SQL_TABLE_RE.findall(content))
+    return table
+
+class _SymbolTableCache:
+    """Thread-safe LRU cache of symbol tables keyed by language and content hash."""
+
+    def __init__(self, max_size: int = SYMBOL_TABLE_CACHE_SIZE):
+        self.max_size = max_size
+        self._tables: "OrderedDict[Tuple[str, str], SymbolTable]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_build(self, content: str, language: str) -> SymbolTable:
+        digest = content_hash(content)
+        key = (language, digest)
+        with self._lock:
+            table = self._tables.get(key)
+            if table is not None:
+                self._tables.move_to_end(key)
+                self.hits += 1
+                return table
+            self.misses += 1
+
+        table = _analyze(content, language, digest)
+
+        with self._lock:
+            self._tables[key] = table
+            self._tables.move_to_end(key)
+            while len(self._tables) > self.max_size:
+                self._tables.popitem(last=False)
+        return table
+
+    def clear(self) -> None:
+        with self._lock:
+            self._tables.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {"cached_tables": len(self._tables), "hits": self.hits, "misses": self.misses}
+
+# Create singleton instance
+symbol_table_cache = _SymbolTableCache()
+
+def get_symbol_table(content: str, file_path: str = "", language: Optional[str] = None) -> SymbolTable:
+    """
+    Get the symbol table for a source file, analysing it at most once.
+
+    Args:
+        content: File content
+        file_path: Path of the file, used to detect its language
+        language: Language override
+
+    Returns:
+        SymbolTable: Shared, read-only symbol table
+    """
+    language = language or detect_language(file_path, content)
+    return symbol_table_cache.get_or_build(content, language)
+
+def analyze_files(files: Dict[str, str], language: Optional[str] = None) -> Dict[str, SymbolTable]:
+    """
+    Get symbol tables for a set of files.
+
+    Args:
+        files: File paths mapped to content
+        language: Language override applied to every file
+
+    Returns:
+        Dict[str, SymbolTable]: File paths mapped to symbol tables
+    """
+    return {
+        file_path: get_symbol_table(content, file_path, language)
+        for file_path, content in files.items()
+        if isinstance(content, str)
+    }
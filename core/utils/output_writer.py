@@ -0,0 +1,289 @@
+import asyncio
+import io
+import json
+import os
+import posixpath
+import tarfile
+import tempfile
+import time
+import uuid
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Any, Optional
+from core.logging.logger import setup_logger
+
+# Initialize logger
+logger = setup_logger("core.utils.output_writer")
+
+# Default number of threads writing files concurrently
+DEFAULT_WRITE_WORKERS = 8
+
+# Supported bundle formats mapped to their file extensions
+BUNDLE_FORMATS = {
+    "zip": ".zip",
+    "tar": ".tar",
+    "tar.gz": ".tar.gz",
+}
+
+# Permissions for written files and bundles, which are staged as owner-only temporary files
+FILE_MODE = 0o644
+
+# Root of the project, used to anchor a relative output root
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+# Root holding one output directory per session; relative paths are resolved against the project root, not the CWD
+GENERATED_OUTPUT_ROOT = str(PROJECT_ROOT / os.getenv("GENERATED_OUTPUT_DIR", "generated_output"))
+
+def session_output_dir(session_id: Optional[str] = None) -> str:
+    """
+    Get the directory a session's generated output is written to.
+
+    Everything generated for a session (agent output and run script
+    output) is written below this directory, which is also where the
+    export routes serve it from. Runs of the same session share it, so
+    unchanged components are reused between them; runs without a session
+    get a directory of their own, so concurrent runs never write over
+    each other.
+
+    Args:
+        session_id: ID of the session the run belongs to
+
+    Returns:
+        str: Absolute output directory, GENERATED_OUTPUT_ROOT/<session_id>
+    """
+    name = str(session_id) if session_id else f"run_{uuid.uuid4().hex}"
+    if name in (".", "..") or "/" in name or "\\" in name:
+        raise ValueError(f"Invalid session ID for an output directory: {session_id}")
+    return os.path.join(GENERATED_OUTPUT_ROOT, name)
+
+def encode_content(content: Any) -> bytes:
+    """
+    Encode file content for writing.
+
+    Strings are UTF-8 encoded, bytes are kept as-is, dicts and lists are
+    written as indented JSON (values JSON cannot represent are converted to
+    strings) and anything else is converted to a string.
+
+    Args:
+        content: File content
+
+    Returns:
+        bytes: Encoded content
+    """
+    if isinstance(content, bytes):
+        return content
+    if isinstance(content, str):
+        return content.encode("utf-8")
+    if isinstance(content, (dict, list)):
+        return json.dumps(content, indent=2, default=str).encode("utf-8")
+    return str(content).encode("utf-8")
+
+def write_atomic(path: str, content: Any) -> None:
+    """
+    Write a file by renaming a fully written temporary file into place.
+
+    Readers never see a partially written file, and a failed write leaves
+    any previous version untouched. The parent directory must exist.
+
+    Args:
+        path: Target file path
+        content: File content
+    """
+    directory = os.path.dirname(path) or "."
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(path)}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(encode_content(content))
+        os.chmod(tmp_path, FILE_MODE)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+def write_files_sync(files: Dict[str, Any], max_workers: int = DEFAULT_WRITE_WORKERS) -> Dict[str, Any]:
+    """
+    Write a batch of files concurrently on a thread pool.
+
+    Each parent directory is created once, then every file is written
+    atomically. Failures are reported per file and do not stop the batch.
+
+    Args:
+        files: File paths mapped to content
+        max_workers: Maximum number of writer threads
+
+    Returns:
+        Dict[str, Any]: Paths written and errors keyed by path
+    """
+    result = {"written": [], "errors": {}}
+    if not files:
+        return result
+
+    pending = dict(files)
+    for directory in sorted({os.path.dirname(path) for path in pending if os.path.dirname(path)}):
+        try:
+            os.makedirs(directory, exist_ok=True)
+        except OSError as e:
+            for path in [p for p in pending if os.path.dirname(p) == directory]:
+                result["errors"][path] = str(e)
+                del pending[path]
+
+    def write(item):
+        path, content = item
+        try:
+            write_atomic(path, content)
+            return path, None
+        except Exception as e:
+            return path, str(e)
+
+    start_time = time.time()
+    workers = max(1, min(max_workers, len(pending)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="output-writer") as executor:
+        for path, error in executor.map(write, pending.items()):
+            if error is None:
+                result["written"].append(path)
+            else:
+                result["errors"][path] = error
+
+    logger.debug(f"Wrote {len(result['written'])} files in {time.time() - start_time:.3f}s "
+                 f"with {workers} threads ({len(result['errors'])} errors)")
+    return result
+
+async def write_files(files: Dict[str, Any], max_workers: int = DEFAULT_WRITE_WORKERS) -> Dict[str, Any]:
+    """
+    Write a batch of files without blocking the event loop.
+
+    Args:
+        files: File paths mapped to content
+        max_workers: Maximum number of writer threads
+
+    Returns:
+        Dict[str, Any]: Paths written and errors keyed by path
+    """
+    return await asyncio.to_thread(write_files_sync, files, max_workers)
+
+def bundle_path_for(base_path: str, bundle_format: str) -> str:
+    """Path of a bundle named after base_path in the given format."""
+    if bundle_format not in BUNDLE_FORMATS:
+        raise ValueError(f"Unsupported bundle format: {bundle_format}. Use one of {sorted(BUNDLE_FORMATS)}")
+    return f"{base_path}{BUNDLE_FORMATS[bundle_format]}"
+
+def write_bundle_sync(
+    files: Dict[str, Any],
+    bundle_path: str,
+    bundle_format: str = "zip",
+    root_dir: Optional[str] = None
+) -> str:
+    """
+    Write files into a single zip or tar archive instead of a directory tree.
+
+    The archive is built next to its target and renamed into place.
+    Member paths that would extract outside the archive root are rejected.
+
+    Args:
+        files: Paths relative to the project root mapped to content
+        bundle_path: Path of the archive to create
+        bundle_format: One of "zip", "tar" or "tar.gz"
+        root_dir: Optional top-level directory inside the archive
+
+    Returns:
+        str: Path of the written archive
+
+    Raises:
+        ValueError: If the format is unsupported or a path escapes the archive root
+    """
+    if bundle_format not in BUNDLE_FORMATS:
+        raise ValueError(f"Unsupported bundle format: {bundle_format}. Use one of {sorted(BUNDLE_FORMATS)}")
+    names = {rel_path: _archive_name(rel_path, root_dir) for rel_path in files}
+
+    directory = os.path.dirname(bundle_path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(bundle_path)}.", suffix=".tmp")
+    os.close(fd)
+    mtime = time.time()
+
+    try:
+        if bundle_format == "zip":
+            with zipfile.ZipFile(tmp_path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+                for rel_path, content in files.items():
+                    archive.writestr(names[rel_path], encode_content(content))
+        else:
+            mode = "w:gz" if bundle_format == "tar.gz" else "w"
+            with tarfile.open(tmp_path, mode) as archive:
+                for rel_path, content in files.items():
+                    data = encode_content(content)
+                    info = tarfile.TarInfo(names[rel_path])
+                    info.size = len(data)
+                    info.mtime = mtime
+                    info.mode = FILE_MODE
+                    archive.addfile(info, io.BytesIO(data))
+        os.chmod(tmp_path, FILE_MODE)
+        os.replace(tmp_path, bundle_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+    logger.info(f"Wrote {bundle_format} bundle with {len(files)} files to {bundle_path}")
+    return bundle_path
+
+async def write_bundle(
+    files: Dict[str, Any],
+    bundle_path: str,
+    bundle_format: str = "zip",
+    root_dir: Optional[str] = None
+) -> str:
+    """
+    Write a zip or tar bundle without blocking the event loop.
+
+    Args:
+        files: Paths relative to the project root mapped to content
+        bundle_path: Path of the archive to create
+        bundle_format: One of "zip", "tar" or "tar.gz"
+        root_dir: Optional top-level directory inside the archive
+
+    Returns:
+        str: Path of the written archive
+    """
+    return await asyncio.to_thread(write_bundle_sync, files, bundle_path, bundle_format, root_dir)
+
+def safe_project_path(rel_path: str) -> Optional[str]:
+    """
+    Normalize a path relative to a project root, rejecting paths that leave it.
+
+    Callers writing a project skip rejected paths with a warning; the
+    writers themselves raise on them as a last line of defence.
+
+    Args:
+        rel_path: Path relative to the project root
+
+    Returns:
+        Optional[str]: Normalized path with forward slashes, or None if the
+        path escapes the project root or names no file
+    """
+    name = posixpath.normpath(rel_path.replace(os.sep, "/").replace("\\", "/").lstrip("/"))
+    if name in (".", "..") or name.startswith("../"):
+        return None
+    return name
+
+def _archive_name(rel_path: str, root_dir: Optional[str]) -> str:
+    """
+    Normalize a relative path for use as an archive member name.
+
+    Raises:
+        ValueError: If the path or root_dir would escape the archive root
+    """
+    name = safe_project_path(rel_path)
+    if name is None:
+        raise ValueError(f"Unsafe archive member path: {rel_path}")
+    if root_dir:
+        root = posixpath.normpath(root_dir.replace("\\", "/").strip("/"))
+        if root in (".", "..") or root.startswith("../"):
+            raise ValueError(f"Unsafe archive root directory: {root_dir}")
+        name = f"{root}/{name}"
+    return name
@@ -0,0 +1,294 @@
+import gzip
+import hashlib
+import json
+import os
+import tarfile
+import tempfile
+import time
+import zipfile
+from datetime import datetime
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+from core.logging.logger import setup_logger
+from core.utils.output_writer import BUNDLE_FORMATS, FILE_MODE
+
+# Initialize logger
+logger = setup_logger("core.utils.project_export")
+
+# Size of the pieces files are read and streamed in
+CHUNK_SIZE = 64 * 1024
+
+# Name of the manifest added as the last archive member
+MANIFEST_NAME = "MANIFEST.json"
+
+# Files left out of exports; full_result.json duplicates every file in the tree
+EXCLUDED_FILES = ("full_result.json",)
+
+# Media type served for each bundle format
+MEDIA_TYPES = {
+    "zip": "application/zip",
+    "tar": "application/x-tar",
+    "tar.gz": "application/gzip",
+}
+
+class _ChunkSink:
+    """
+    Write-only, non-seekable stream collecting archive bytes until drained.
+
+    zipfile and tarfile write into it; the export generators hand out
+    whatever has accumulated after every chunk, so only about one chunk
+    is ever held in memory.
+    """
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+
+    def write(self, data: bytes) -> int:
+        if data:
+            self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+def iter_export_files(root_dir: str, exclude: Tuple[str, ...] = EXCLUDED_FILES) -> Iterator[Tuple[str, str]]:
+    """
+    Walk a generated output directory in a stable order.
+
+    Symlinks, temporary files left by atomic writes and excluded top-level
+    files are skipped.
+
+    Args:
+        root_dir: Directory to export
+        exclude: Top-level file names to leave out
+
+    Yields:
+        Tuple[str, str]: Path relative to root_dir (with forward slashes) and absolute path
+    """
+    for dir_path, dir_names, file_names in os.walk(root_dir):
+        dir_names[:] = sorted(d for d in dir_names if not os.path.islink(os.path.join(dir_path, d)))
+        rel_dir = os.path.relpath(dir_path, root_dir)
+        for file_name in sorted(file_names):
+            abs_path = os.path.join(dir_path, file_name)
+            if os.path.islink(abs_path):
+                continue
+            if file_name.startswith(".") and file_name.endswith(".tmp"):
+                continue
+            if rel_dir == "." and file_name in exclude:
+                continue
+            rel_path = file_name if rel_dir == "." else f"{rel_dir}/{file_name}".replace(os.sep, "/")
+            yield rel_path, abs_path
+
+def _read_chunks(f, size: int, chunk_size: int) -> Iterator[bytes]:
+    """Read exactly size bytes from an open file in chunks."""
+    remaining = size
+    while remaining > 0:
+        chunk = f.read(min(chunk_size, remaining))
+        if not chunk:
+            raise OSError(f"File {f.name} shrank while being exported")
+        remaining -= len(chunk)
+        yield chunk
+
+def build_manifest(
+    root_dir: str,
+    exclude: Tuple[str, ...] = EXCLUDED_FILES,
+    chunk_size: int = CHUNK_SIZE
+) -> Dict[str, Any]:
+    """
+    Hash every file of a generated output directory without loading it whole.
+
+    Args:
+        root_dir: Directory to describe
+        exclude: Top-level file names to leave out
+        chunk_size: Size of the pieces files are read in
+
+    Returns:
+        Dict[str, Any]: Manifest with the SHA-256 and size of each file
+    """
+    files = {}
+    for rel_path, abs_path in iter_export_files(root_dir, exclude):
+        digest = hashlib.sha256()
+        with open(abs_path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            for chunk in _read_chunks(f, size, chunk_size):
+                digest.update(chunk)
+        files[rel_path] = {"sha256": digest.hexdigest(), "size": size}
+    return _manifest(files)
+
+def _manifest(files: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    return {
+        "generated_at": datetime.utcnow().isoformat(),
+        "file_count": len(files),
+        "total_size": sum(entry["size"] for entry in files.values()),
+        "files": files,
+    }
+
+def stream_bundle(
+    root_dir: str,
+    bundle_format: str = "zip",
+    root_name: Optional[str] = None,
+    include_manifest: bool = True,
+    exclude: Tuple[str, ...] = EXCLUDED_FILES,
+    chunk_size: int = CHUNK_SIZE
+) -> Iterator[bytes]:
+    """
+    Stream a generated output directory as a zip or tar archive.
+
+    Files are read and compressed chunk by chunk, so memory use does not
+    depend on project size and the first bytes are produced immediately.
+    With include_manifest, a MANIFEST.json holding the SHA-256 and size of
+    every file is appended as the last member.
+
+    Args:
+        root_dir: Directory to export
+        bundle_format: One of "zip", "tar" or "tar.gz"
+        root_name: Optional top-level directory inside the archive
+        include_manifest: Whether to append the hash manifest
+        exclude: Top-level file names to leave out
+        chunk_size: Size of the pieces files are read in
+
+    Yields:
+        bytes: Consecutive pieces of the archive
+    """
+    if bundle_format not in BUNDLE_FORMATS:
+        raise ValueError(f"Unsupported bundle format: {bundle_format}. Use one of {sorted(BUNDLE_FORMATS)}")
+    if not os.path.isdir(root_dir):
+        raise FileNotFoundError(f"Output directory not found: {root_dir}")
+
+    start_time = time.time()
+    writer = _stream_zip if bundle_format == "zip" else _stream_tar
+    members = _iter_members(root_dir, root_name, include_manifest, exclude, chunk_size)
+    total = 0
+    for data in writer(members, bundle_format):
+        if data:
+            total += len(data)
+            yield data
+
+    logger.info(f"Streamed {bundle_format} export of {root_dir} ({total} bytes) in {time.time() - start_time:.2f}s")
+
+def _iter_members(
+    root_dir: str,
+    root_name: Optional[str],
+    include_manifest: bool,
+    exclude: Tuple[str, ...],
+    chunk_size: int
+) -> Iterator[Tuple[str, int, float, Iterator[bytes]]]:
+    """
+    Yield archive members as (name, size, mtime, chunks), hashing files as they are read.
+
+    The manifest member comes last, once every file's hash is known.
+    """
+    prefix = f"{root_name.strip('/')}/" if root_name else ""
+    hashed: Dict[str, Dict[str, Any]] = {}
+
+    for rel_path, abs_path in iter_export_files(root_dir, exclude):
+        with open(abs_path, "rb") as f:
+            stat = os.fstat(f.fileno())
+            digest = hashlib.sha256()
+
+            def chunks(f=f, size=stat.st_size, digest=digest):
+                for chunk in _read_chunks(f, size, chunk_size):
+                    digest.update(chunk)
+                    yield chunk
+
+            yield prefix + rel_path, stat.st_size, stat.st_mtime, chunks()
+            hashed[rel_path] = {"sha256": digest.hexdigest(), "size": stat.st_size}
+
+    if include_manifest:
+        data = json.dumps(_manifest(hashed), indent=2).encode("utf-8")
+        yield prefix + MANIFEST_NAME, len(data), time.time(), iter([data])
+
+def _stream_zip(members, bundle_format: str) -> Iterator[bytes]:
+    sink = _ChunkSink()
+    with zipfile.ZipFile(sink, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for name, size, mtime, chunks in members:
+            info = zipfile.ZipInfo(name, date_time=time.localtime(max(mtime, 315532800))[:6])
+            info.compress_type = zipfile.ZIP_DEFLATED
+            info.external_attr = 0o644 << 16
+            info.file_size = size
+            with archive.open(info, "w", force_zip64=size > zipfile.ZIP64_LIMIT) as member:
+                for chunk in chunks:
+                    member.write(chunk)
+                    yield sink.drain()
+            yield sink.drain()
+    yield sink.drain()
+
+def _stream_tar(members, bundle_format: str) -> Iterator[bytes]:
+    sink = _ChunkSink()
+    out = gzip.GzipFile(fileobj=sink, mode="wb") if bundle_format == "tar.gz" else sink
+    offset = 0
+
+    for name, size, mtime, chunks in members:
+        info = tarfile.TarInfo(name)
+        info.size = size
+        info.mtime = int(mtime)
+        info.mode = 0o644
+        header = info.tobuf(tarfile.DEFAULT_FORMAT, tarfile.ENCODING, "surrogateescape")
+        out.write(header)
+        offset += len(header)
+        for chunk in chunks:
+            out.write(chunk)
+            yield sink.drain()
+        remainder = size % tarfile.BLOCKSIZE
+        if remainder:
+            out.write(tarfile.NUL * (tarfile.BLOCKSIZE - remainder))
+        offset += size + (tarfile.BLOCKSIZE - remainder if remainder else 0)
+        yield sink.drain()
+
+    # End-of-archive marker, padded to a full record like tarfile does
+    out.write(tarfile.NUL * (tarfile.BLOCKSIZE * 2))
+    offset += tarfile.BLOCKSIZE * 2
+    remainder = offset % tarfile.RECORDSIZE
+    if remainder:
+        out.write(tarfile.NUL * (tarfile.RECORDSIZE - remainder))
+    if out is not sink:
+        out.close()
+    yield sink.drain()
+
+def export_bundle(
+    root_dir: str,
+    bundle_path: str,
+    bundle_format: str = "zip",
+    root_name: Optional[str] = None,
+    include_manifest: bool = True
+) -> str:
+    """
+    Write a streamed export of a generated output directory to a file.
+
+    The archive is streamed into a temporary file next to its target and
+    renamed into place.
+
+    Args:
+        root_dir: Directory to export
+        bundle_path: Path of the archive to create
+        bundle_format: One of "zip", "tar" or "tar.gz"
+        root_name: Optional top-level directory inside the archive
+        include_manifest: Whether to append the hash manifest
+
+    Returns:
+        str: Path of the written archive
+    """
+    directory = os.path.dirname(bundle_path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(bundle_path)}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            for chunk in stream_bundle(root_dir, bundle_format, root_name, include_manifest):
+                f.write(chunk)
+        os.chmod(tmp_path, FILE_MODE)
+        os.replace(tmp_path, bundle_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+    return bundle_path
+
+def bundle_filename(name: str, bundle_format: str) -> str:
+    """File name for a bundle of the given format."""
+    return f"{name}{BUNDLE_FORMATS[bundle_format]}"